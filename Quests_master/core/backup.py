@@ -0,0 +1,158 @@
+"""Онлайн-бэкап quest_master.db через SQLite backup API.
+
+Копирование идёт пачками страниц с паузами между ними, поэтому автосохранение
+не ждёт. Источник читается внутри одной транзакции чтения (БД в режиме WAL),
+так что снимок согласован на момент начала бэкапа, а писатели не блокируются.
+
+    python -m core.backup --keep 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from core.database import DB_PATH
+
+
+BACKUP_DIR = Path(__file__).resolve().parent.parent / "backups"
+
+PAGES_PER_STEP = 256
+STEP_PAUSE = 0.005  # сек между пачками страниц
+KEEP_BACKUPS = 10
+
+# (скопировано страниц, всего страниц)
+BackupProgress = Callable[[int, int], None]
+
+
+class BackupCancelled(Exception):
+    """Бэкап прерван по запросу (например, при закрытии окна)."""
+
+
+@dataclass
+class BackupResult:
+    path: Path
+    size_bytes: int
+    seconds: float
+    pages: int
+
+    @property
+    def seconds_per_gb(self) -> float:
+        if self.size_bytes == 0:
+            return 0.0
+        return self.seconds / (self.size_bytes / 1024 ** 3)
+
+    def summary(self) -> str:
+        mb = self.size_bytes / 1024 ** 2
+        return (
+            f"{self.path.name}: {mb:.1f} МБ за {self.seconds:.2f} с "
+            f"({self.seconds_per_gb:.1f} с/ГБ)"
+        )
+
+
+def list_backups(dest_dir: Path, stem: str) -> List[Path]:
+    """Снимки данной БД, от новых к старым."""
+    return sorted(dest_dir.glob(f"{stem}-*.db"), reverse=True)
+
+
+def rotate_backups(dest_dir: Path, stem: str, keep: int) -> List[Path]:
+    """Удаляет всё, кроме keep последних снимков; возвращает удалённые."""
+    removed = list_backups(dest_dir, stem)[keep:]
+    for path in removed:
+        path.unlink()
+    return removed
+
+
+def backup_database(
+    db_path: Path = DB_PATH,
+    dest_dir: Path = BACKUP_DIR,
+    pages_per_step: int = PAGES_PER_STEP,
+    pause: float = STEP_PAUSE,
+    keep: int = KEEP_BACKUPS,
+    progress: Optional[BackupProgress] = None,
+    cancelled: Optional[Callable[[], bool]] = None,
+) -> BackupResult:
+    """Снимок БД в dest_dir/<имя>-YYYYmmdd_HHMMSS.db с ротацией.
+
+    Блокирует вызывающий поток — из GUI запускать в фоне. cancelled
+    проверяется после каждой пачки страниц: если вернул True, бэкап
+    прерывается с BackupCancelled, недописанный файл удаляется.
+    """
+    db_path = Path(db_path)
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    target = dest_dir / f"{db_path.stem}-{stamp}.db"
+    partial = target.with_suffix(".db.partial")
+
+    start = time.perf_counter()
+    pages = 0
+
+    def on_step(status: int, remaining: int, total: int) -> None:
+        nonlocal pages
+        pages = total
+        if progress is not None:
+            progress(total - remaining, total)
+        if cancelled is not None and cancelled():
+            raise BackupCancelled(str(db_path))
+        if remaining:
+            time.sleep(pause)
+
+    # Своё соединение: sqlite3-соединения нельзя делить между потоками
+    src = sqlite3.connect(db_path)
+    dst = sqlite3.connect(partial)
+    try:
+        # Держим транзакцию чтения: все пачки копируются из одного снимка
+        src.execute("BEGIN")
+        src.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+        src.backup(dst, pages=pages_per_step, progress=on_step)
+    except BaseException:
+        dst.close()
+        partial.unlink(missing_ok=True)
+        raise
+    finally:
+        src.close()
+    dst.close()
+    os.replace(partial, target)
+
+    seconds = time.perf_counter() - start
+    rotate_backups(dest_dir, db_path.stem, keep)
+    return BackupResult(
+        path=target,
+        size_bytes=target.stat().st_size,
+        seconds=seconds,
+        pages=pages,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Онлайн-бэкап quest_master.db")
+    parser.add_argument("--db", default=str(DB_PATH))
+    parser.add_argument("--dest", default=str(BACKUP_DIR))
+    parser.add_argument("--keep", type=int, default=KEEP_BACKUPS)
+    parser.add_argument("--pages", type=int, default=PAGES_PER_STEP, help="страниц за шаг")
+    parser.add_argument("--pause", type=float, default=STEP_PAUSE, help="пауза между шагами, с")
+    args = parser.parse_args(argv)
+
+    def report(done: int, total: int) -> None:
+        print(f"\r{done}/{total} страниц", end="", file=sys.stderr, flush=True)
+
+    result = backup_database(
+        Path(args.db),
+        Path(args.dest),
+        args.pages,
+        args.pause,
+        args.keep,
+        report,
+    )
+    print(f"\r{result.summary()}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List
+
+from core.database import Database
+
+
+CAMPAIGNS_DIR = Path(__file__).resolve().parent.parent / "campaigns"
+CATALOG_NAME = "catalog.db"
+
+# Сколько шардов держим открытыми и сколько секунд шард может простаивать
+MAX_OPEN_SHARDS = 8
+IDLE_TIMEOUT = 300.0
+# SQLite по умолчанию разрешает 10 ATTACH на соединение
+ATTACH_BATCH = 8
+
+
+class CampaignStore:
+    """Каталог кампаний + по файлу БД на кампанию.
+
+    Шарды открываются лениво. Лишние сверх MAX_OPEN_SHARDS закрываются
+    сразу при открытии нового, простаивающие дольше IDLE_TIMEOUT — в
+    close_idle(): его вызывает shard(), а владелец хранилища, если шарды
+    долго не запрашиваются, — периодически сам.
+    Поиск по всем кампаниям идёт через ATTACH шардов к соединению каталога.
+    """
+
+    def __init__(
+        self,
+        root: Path = CAMPAIGNS_DIR,
+        max_open: int = MAX_OPEN_SHARDS,
+        idle_timeout: float = IDLE_TIMEOUT,
+    ) -> None:
+        self.root = root
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_open = max_open
+        self.idle_timeout = idle_timeout
+        # campaign_id -> (Database, время последнего обращения); LRU-порядок
+        self._open: "OrderedDict[int, List[Any]]" = OrderedDict()
+
+        self.catalog = sqlite3.connect(self.root / CATALOG_NAME)
+        self.catalog.row_factory = sqlite3.Row
+        self.catalog.execute(
+            """
+            CREATE TABLE IF NOT EXISTS campaigns (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL UNIQUE,
+                file TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            """
+        )
+        self.catalog.commit()
+
+    # ---------- Каталог ----------
+
+    def create_campaign(self, name: str) -> int:
+        cur = self.catalog.cursor()
+        cur.execute("INSERT INTO campaigns (name, file) VALUES (?, '')", (name,))
+        campaign_id = cur.lastrowid
+        cur.execute(
+            "UPDATE campaigns SET file = ? WHERE id = ?",
+            (f"campaign_{campaign_id}.db", campaign_id),
+        )
+        self.catalog.commit()
+        return campaign_id
+
+    def list_campaigns(self) -> List[Dict[str, Any]]:
+        cur = self.catalog.execute("SELECT id, name, file, created_at FROM campaigns ORDER BY id")
+        return [dict(row) for row in cur.fetchall()]
+
+    def _shard_path(self, campaign_id: int) -> Path:
+        row = self.catalog.execute(
+            "SELECT file FROM campaigns WHERE id = ?", (campaign_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"Unknown campaign: {campaign_id}")
+        return self.root / row["file"]
+
+    # ---------- Шарды ----------
+
+    def shard(self, campaign_id: int) -> ShardHandle:
+        """Ссылка на БД кампании; шард открывается сразу.
+
+        Ссылку можно хранить: если шард вытеснен, следующее обращение
+        откроет его заново. Не храните только handle.conn и курсоры —
+        они закрываются вместе с вытесненным шардом.
+        """
+        self._checkout(campaign_id)
+        return ShardHandle(self, campaign_id)
+
+    def _checkout(self, campaign_id: int) -> Database:
+        """Открытая БД кампании; отмечает обращение для LRU."""
+        entry = self._open.get(campaign_id)
+        if entry is None:
+            entry = [Database(self._shard_path(campaign_id)), 0.0]
+            self._open[campaign_id] = entry
+        entry[1] = time.monotonic()
+        self._open.move_to_end(campaign_id)
+        self.close_idle()
+        return entry[0]
+
+    def close_idle(self) -> List[int]:
+        """Закрывает простаивающие шарды и лишние сверх max_open.
+
+        Соединения sqlite3 привязаны к потоку: вызывать из того же потока,
+        что и shard().
+        """
+        now = time.monotonic()
+        closed: List[int] = []
+        for campaign_id, (db, last_used) in list(self._open.items()):
+            too_many = len(self._open) > self.max_open
+            if too_many or now - last_used > self.idle_timeout:
+                db.close()
+                del self._open[campaign_id]
+                closed.append(campaign_id)
+        return closed
+
+    def open_shards(self) -> List[int]:
+        """Открытые шарды, от давно не использованных к свежим."""
+        return list(self._open)
+
+    def close(self) -> None:
+        for db, _ in self._open.values():
+            db.close()
+        self._open.clear()
+        self.catalog.close()
+
+    # ---------- Запросы по всем кампаниям ----------
+
+    def search_quests(self, text: str = "", limit: int = 100) -> List[Dict[str, Any]]:
+        """Квесты всех кампаний (новые первыми), с фильтром по названию."""
+        campaigns = self.list_campaigns()
+        results: List[Dict[str, Any]] = []
+        for start in range(0, len(campaigns), ATTACH_BATCH):
+            batch = [
+                c for c in campaigns[start:start + ATTACH_BATCH]
+                if (self.root / c["file"]).exists()
+            ]
+            if not batch:
+                continue
+            results.extend(self._search_batch(batch, text, limit))
+            results.sort(key=lambda r: (r["created_at"] or "", r["id"]), reverse=True)
+            del results[limit:]
+        return results
+
+    def _search_batch(
+        self,
+        campaigns: List[Dict[str, Any]],
+        text: str,
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        aliases = []
+        try:
+            for i, campaign in enumerate(campaigns):
+                alias = f"shard{i}"
+                self.catalog.execute(
+                    f"ATTACH DATABASE ? AS {alias}", (str(self.root / campaign["file"]),)
+                )
+                aliases.append(alias)
+
+            selects = []
+            params: List[Any] = []
+            for alias, campaign in zip(aliases, campaigns):
+                select = (
+                    f"SELECT ? AS campaign_id, ? AS campaign, id, title, difficulty, "
+                    f"reward, deadline, created_at FROM {alias}.quests"
+                )
+                params += [campaign["id"], campaign["name"]]
+                if text:
+                    select += " WHERE title LIKE ?"
+                    params.append(f"%{text}%")
+                selects.append(select)
+            sql = (
+                " UNION ALL ".join(selects)
+                + " ORDER BY created_at DESC, id DESC LIMIT ?"
+            )
+            params.append(limit)
+            return [dict(row) for row in self.catalog.execute(sql, params).fetchall()]
+        finally:
+            for alias in aliases:
+                self.catalog.execute(f"DETACH DATABASE {alias}")
+
+
+class ShardHandle:
+    """БД кампании, которая переживает вытеснение шарда из CampaignStore.
+
+    Атрибуты и методы Database берутся у открытого шарда в момент
+    обращения, при необходимости шард открывается заново.
+    """
+
+    def __init__(self, store: CampaignStore, campaign_id: int) -> None:
+        self._store = store
+        self.campaign_id = campaign_id
+
+    @property
+    def db(self) -> Database:
+        return self._store._checkout(self.campaign_id)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.db, name)
@@ -0,0 +1,326 @@
+"""Потоковый импорт/экспорт таблиц в JSONL/CSV (опционально .gz).
+
+Память постоянна: экспорт идёт keyset-страницами по id, импорт читает файл
+генератором и пишет пачками. Позиция импорта хранится в той же транзакции,
+что и пачка строк, поэтому прерванный импорт продолжается без дублей.
+Вместе с позицией хранится отпечаток файла: подменённый файл грузится заново.
+
+    python -m core.data_transfer export quests quests.jsonl.gz
+    python -m core.data_transfer import quests quests.jsonl.gz --on-conflict replace
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import gzip
+import hashlib
+import io
+import json
+import sqlite3
+import sys
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from core.database import DB_PATH, Database
+
+
+# Колонки и признак «текстовая» (пустая строка CSV в нетекстовой колонке = NULL)
+TABLES: Dict[str, List[Tuple[str, bool]]] = {
+    "quests": [
+        ("id", False),
+        ("title", True),
+        ("difficulty", True),
+        ("reward", False),
+        ("description", True),
+        ("deadline", True),
+        ("created_at", True),
+    ],
+    "quest_versions": [
+        ("id", False),
+        ("quest_id", False),
+        ("title", True),
+        ("difficulty", True),
+        ("reward", False),
+        ("description", True),
+        ("created_at", True),
+    ],
+    "quest_locations": [
+        ("id", False),
+        ("quest_id", False),
+        ("x", False),
+        ("y", False),
+        ("kind", True),
+        ("label", True),
+    ],
+}
+
+# Порядок, в котором таблицы можно грузить без нарушения ссылок
+TABLE_ORDER = ["quests", "quest_versions", "quest_locations"]
+
+BATCH_SIZE = 5000
+# Сколько байт начала файла входит в отпечаток для чекпойнта
+FINGERPRINT_HEAD = 64 * 1024
+
+CONFLICT_MODES = {"abort": "INSERT", "replace": "INSERT OR REPLACE", "skip": "INSERT OR IGNORE"}
+
+ProgressCallback = Callable[[int], None]
+
+
+def _columns(table: str) -> List[str]:
+    if table not in TABLES:
+        raise ValueError(f"Unknown table: {table}")
+    return [name for name, _ in TABLES[table]]
+
+
+def _detect_format(path: Path) -> Tuple[str, bool]:
+    """('jsonl' | 'csv', gzip?) по расширению файла."""
+    suffixes = [s.lower() for s in path.suffixes]
+    compressed = bool(suffixes) and suffixes[-1] == ".gz"
+    if compressed:
+        suffixes = suffixes[:-1]
+    fmt = suffixes[-1].lstrip(".") if suffixes else ""
+    if fmt not in ("jsonl", "csv"):
+        raise ValueError(f"Unsupported file format: {path.name} (expected .jsonl/.csv[.gz])")
+    return fmt, compressed
+
+
+def _open_text(path: Path, mode: str, compressed: bool) -> IO[str]:
+    if compressed:
+        # Уровень 6 — разумный компромисс скорость/размер для миллионов строк
+        return io.TextIOWrapper(
+            gzip.open(path, mode + "b", compresslevel=6),
+            encoding="utf-8",
+            newline="",
+        )
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+# ---------- Экспорт ----------
+
+def iter_rows(db: Database, table: str, batch_size: int = BATCH_SIZE) -> Iterator[Tuple[Any, ...]]:
+    """Строки таблицы по возрастанию id, keyset-страницами."""
+    columns = _columns(table)
+    sql = f"SELECT {', '.join(columns)} FROM {table} WHERE id > ? ORDER BY id LIMIT ?"
+    last_id = 0
+    while True:
+        rows = db.conn.execute(sql, (last_id, batch_size)).fetchall()
+        if not rows:
+            return
+        for row in rows:
+            yield tuple(row)
+        last_id = rows[-1][0]
+
+
+def export_table(
+    db: Database,
+    table: str,
+    path: Path,
+    batch_size: int = BATCH_SIZE,
+    progress: Optional[ProgressCallback] = None,
+) -> int:
+    """Выгружает таблицу в файл; возвращает число строк."""
+    path = Path(path)
+    fmt, compressed = _detect_format(path)
+    columns = _columns(table)
+    count = 0
+    with _open_text(path, "w", compressed) as fh:
+        if fmt == "csv":
+            writer = csv.writer(fh)
+            writer.writerow(columns)
+            write = writer.writerow
+        else:
+            dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+            def write(row: Tuple[Any, ...]) -> None:
+                fh.write(dumps(dict(zip(columns, row))))
+                fh.write("\n")
+
+        for row in iter_rows(db, table, batch_size):
+            write(row)
+            count += 1
+            if progress is not None and count % batch_size == 0:
+                progress(count)
+    if progress is not None:
+        progress(count)
+    return count
+
+
+# ---------- Импорт ----------
+
+def read_records(path: Path, table: str) -> Iterator[Tuple[Any, ...]]:
+    """Генератор кортежей в порядке колонок таблицы."""
+    path = Path(path)
+    fmt, compressed = _detect_format(path)
+    _columns(table)
+    spec = TABLES[table]
+    with _open_text(path, "r", compressed) as fh:
+        if fmt == "csv":
+            reader = csv.DictReader(fh)
+            for record in reader:
+                yield tuple(
+                    record.get(name) if is_text or record.get(name) != "" else None
+                    for name, is_text in spec
+                )
+        else:
+            loads = json.JSONDecoder().decode
+            for line in fh:
+                if not line.strip():
+                    continue
+                record = loads(line)
+                yield tuple(record.get(name) for name, _ in spec)
+
+
+def file_fingerprint(path: Path) -> str:
+    """Размер, mtime и хэш начала файла — меняется, если файл подменили."""
+    stat = path.stat()
+    with open(path, "rb") as fh:
+        head = hashlib.sha1(fh.read(FINGERPRINT_HEAD)).hexdigest()
+    return f"{stat.st_size}:{stat.st_mtime_ns}:{head}"
+
+
+def _ensure_checkpoint_table(db: Database) -> None:
+    db.conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS import_checkpoints (
+            source TEXT PRIMARY KEY,
+            rows_done INTEGER NOT NULL,
+            fingerprint TEXT NOT NULL
+        )
+        """
+    )
+    db.conn.commit()
+
+
+def import_table(
+    db: Database,
+    table: str,
+    path: Path,
+    batch_size: int = BATCH_SIZE,
+    on_conflict: str = "abort",
+    resume: bool = True,
+    progress: Optional[ProgressCallback] = None,
+) -> int:
+    """Загружает файл в таблицу пачками; возвращает число обработанных строк файла.
+
+    on_conflict: abort | replace | skip — что делать с уже существующим id.
+    При resume=True прерванный импорт того же файла продолжается с места остановки;
+    если файл с тех пор изменился (другой отпечаток), импорт идёт с начала.
+    """
+    if on_conflict not in CONFLICT_MODES:
+        raise ValueError(f"Unknown conflict mode: {on_conflict}")
+    path = Path(path)
+    columns = _columns(table)
+    sql = (
+        f"{CONFLICT_MODES[on_conflict]} INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)})"
+    )
+    source = f"{table}:{path.resolve()}"
+    fingerprint = file_fingerprint(path)
+
+    _ensure_checkpoint_table(db)
+    done = 0
+    if resume:
+        row = db.conn.execute(
+            "SELECT rows_done, fingerprint FROM import_checkpoints WHERE source = ?",
+            (source,),
+        ).fetchone()
+        if row is not None and row[1] == fingerprint:
+            done = row[0]
+
+    records = read_records(path, table)
+    for _ in range(done):
+        next(records, None)
+
+    conn = db.conn
+    batch: List[Tuple[Any, ...]] = []
+
+    def flush() -> None:
+        nonlocal done
+        # Пачка и позиция — в одной транзакции
+        with conn:
+            conn.executemany(sql, batch)
+            done += len(batch)
+            conn.execute(
+                "INSERT OR REPLACE INTO import_checkpoints (source, rows_done, fingerprint) "
+                "VALUES (?, ?, ?)",
+                (source, done, fingerprint),
+            )
+        batch.clear()
+        if progress is not None:
+            progress(done)
+
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+
+    with conn:
+        conn.execute("DELETE FROM import_checkpoints WHERE source = ?", (source,))
+    if table == "quests":
+        # deadline_epoch не переносится — вычисляем из deadline
+        db.backfill_deadline_epochs()
+    return done
+
+
+# ---------- CLI ----------
+
+def _print_progress(table: str) -> ProgressCallback:
+    def report(rows: int) -> None:
+        print(f"\r{table}: {rows} строк", end="", file=sys.stderr, flush=True)
+
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Импорт/экспорт квестов в JSONL/CSV")
+    parser.add_argument("action", choices=["export", "import"])
+    parser.add_argument("table", choices=list(TABLES) + ["all"])
+    parser.add_argument(
+        "path",
+        help="файл (.jsonl/.csv[.gz]); для all — каталог, формат задаёт --format",
+    )
+    parser.add_argument("--db", default=str(DB_PATH), help="путь к quest_master.db")
+    parser.add_argument("--format", default="jsonl.gz", help="для all: jsonl, csv, jsonl.gz, csv.gz")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--on-conflict", choices=list(CONFLICT_MODES), default="abort")
+    parser.add_argument("--no-resume", action="store_true", help="начать импорт заново")
+    args = parser.parse_args(argv)
+
+    db = Database(Path(args.db))
+    if args.table == "all":
+        directory = Path(args.path)
+        directory.mkdir(parents=True, exist_ok=True)
+        jobs = [(t, directory / f"{t}.{args.format}") for t in TABLE_ORDER]
+    else:
+        jobs = [(args.table, Path(args.path))]
+
+    for table, path in jobs:
+        if args.action == "export":
+            rows = export_table(db, table, path, args.batch_size, _print_progress(table))
+        else:
+            try:
+                rows = import_table(
+                    db,
+                    table,
+                    path,
+                    args.batch_size,
+                    args.on_conflict,
+                    not args.no_resume,
+                    _print_progress(table),
+                )
+            except sqlite3.IntegrityError as exc:
+                # Чаще всего — id уже есть (например, черновик, созданный GUI)
+                parser.exit(
+                    1,
+                    f"\n{table}: {exc} — {path}\n"
+                    "Строки с такими id уже есть в БД. Повторите с --on-conflict skip "
+                    "(оставить существующие) или --on-conflict replace (перезаписать).\n",
+                )
+        print(f"\r{table}: {rows} строк — {path}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
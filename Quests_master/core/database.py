@@ -2,12 +2,45 @@ from __future__ import annotations
 
 import sqlite3
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 DB_PATH = Path(__file__).resolve().parent.parent / "quest_master.db"
 
+# Колонки, по которым браузер квестов может сортировать (и для них есть индексы)
+SORTABLE_QUEST_COLUMNS = ("id", "title", "difficulty", "reward", "deadline", "created_at")
+
+# Компактная строка для списка квестов: без описания
+QuestRow = Tuple[int, str, str, int, str, str]
+
+# (deadline_epoch, id, title) — элемент расписания дедлайнов
+DeadlineRow = Tuple[int, int, str]
+
+MIGRATION_BATCH = 5000
+
+
+def deadline_to_epoch(value: Optional[str]) -> Optional[int]:
+    """ISO-строка дедлайна -> unix-время; '' и мусор -> None.
+
+    Время без часового пояса считается локальным (так его пишет QDateTimeEdit).
+    Даты на краях диапазона (0001 и 9999 годы), которые не переводятся в
+    UTC или в локальное время платформы, тоже дают None.
+    """
+    if not value:
+        return None
+    text = value.strip()
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    try:
+        dt = datetime.fromisoformat(text)
+        if dt.tzinfo is None:
+            dt = dt.astimezone()
+        return int(dt.astimezone(timezone.utc).timestamp())
+    except (ValueError, OverflowError, OSError):
+        return None
+
 
 @dataclass
 class Quest:
@@ -23,11 +56,20 @@ class Quest:
 class Database:
     """SQLite CRUD + версия квестов + локации."""
 
+    # Подменяется core.profiling.install() для замера SQL
+    connection_factory: type = sqlite3.Connection
+
     def __init__(self, db_path: Path = DB_PATH) -> None:
-        self.conn = sqlite3.connect(db_path)
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, factory=self.connection_factory)
         self.conn.row_factory = sqlite3.Row
+        # WAL: онлайн-бэкап и читатели не блокируют автосохранение
+        self.conn.execute("PRAGMA journal_mode=WAL")
         self._create_schema()
 
+    def close(self) -> None:
+        self.conn.close()
+
     def _create_schema(self) -> None:
         cur = self.conn.cursor()
         # Основные таблицы из задания
@@ -72,8 +114,77 @@ class Database:
             );
             """
         )
+        self._migrate_deadline_epoch(cur)
+        # Индексы под keyset-пагинацию браузера квестов: (колонка, id)
+        for column in SORTABLE_QUEST_COLUMNS[1:]:
+            cur.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_quests_{column} ON quests({column}, id)"
+            )
+        # Полная история достижений (в памяти держим только последние)
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS achievements (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                text TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            """
+        )
         self.conn.commit()
 
+    def _migrate_deadline_epoch(self, cur: sqlite3.Cursor) -> None:
+        """Добавляет quests.deadline_epoch (индексированное unix-время дедлайна)."""
+        columns = {row[1] for row in cur.execute("PRAGMA table_info(quests)")}
+        if "deadline_epoch" not in columns:
+            # Колонка и заполнение — одна транзакция: прерванная миграция
+            # откатывается целиком и повторяется при следующем запуске
+            cur.execute("BEGIN")
+            try:
+                cur.execute("ALTER TABLE quests ADD COLUMN deadline_epoch INTEGER")
+                self.backfill_deadline_epochs(commit=False)
+            except BaseException:
+                self.conn.rollback()
+                raise
+            self.conn.commit()
+        cur.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_quests_deadline_epoch
+            ON quests(deadline_epoch, id) WHERE deadline_epoch IS NOT NULL
+            """
+        )
+
+    def backfill_deadline_epochs(self, commit: bool = True) -> int:
+        """Заполняет deadline_epoch из строкового deadline (после миграции/импорта).
+
+        commit=False — не коммитить пачки (вызов внутри чужой транзакции).
+        """
+        updated = 0
+        last_id = 0
+        while True:
+            rows = self.conn.execute(
+                """
+                SELECT id, deadline FROM quests
+                WHERE id > ? AND deadline_epoch IS NULL AND deadline <> ''
+                ORDER BY id LIMIT ?
+                """,
+                (last_id, MIGRATION_BATCH),
+            ).fetchall()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            values = [
+                (epoch, row[0])
+                for row in rows
+                if (epoch := deadline_to_epoch(row[1])) is not None
+            ]
+            self.conn.executemany(
+                "UPDATE quests SET deadline_epoch = ? WHERE id = ?", values
+            )
+            if commit:
+                self.conn.commit()
+            updated += len(values)
+        return updated
+
     # ---------- Работа с квестами ----------
 
     def create_draft_quest(self) -> int:
@@ -124,7 +235,13 @@ class Database:
             raise ValueError(f"Unknown quest field: {field}")
 
         cur = self.conn.cursor()
-        cur.execute(f"UPDATE quests SET {field} = ? WHERE id = ?", (value, quest_id))
+        if field == "deadline":
+            cur.execute(
+                "UPDATE quests SET deadline = ?, deadline_epoch = ? WHERE id = ?",
+                (value, deadline_to_epoch(value), quest_id),
+            )
+        else:
+            cur.execute(f"UPDATE quests SET {field} = ? WHERE id = ?", (value, quest_id))
         self.conn.commit()
         self._snapshot_version(quest_id)
 
@@ -150,6 +267,85 @@ class Database:
             return None
         return quest.__dict__.copy()
 
+    def list_quests_page(
+        self,
+        limit: int = 200,
+        sort_column: str = "id",
+        descending: bool = False,
+        after: Optional[Tuple[Any, int]] = None,
+        search: str = "",
+    ) -> List[QuestRow]:
+        """Страница списка квестов (keyset-пагинация).
+
+        after — (значение sort_column, id) последней строки предыдущей страницы.
+        Поиск по названию и сложности выполняется в SQL. NULL в колонке
+        сортировки идут, как и в SQLite, первыми по возрастанию и последними
+        по убыванию; сравнение кортежей с NULL даёт NULL, поэтому строки с NULL
+        выбираются отдельным диапазоном (тоже по индексу).
+        """
+        if sort_column not in SORTABLE_QUEST_COLUMNS:
+            raise ValueError(f"Unknown sort column: {sort_column}")
+
+        order = "DESC" if descending else "ASC"
+        base_where: List[str] = []
+        base_params: List[Any] = []
+        if search:
+            base_where.append("(title LIKE ? OR difficulty LIKE ?)")
+            pattern = f"%{search}%"
+            base_params += [pattern, pattern]
+
+        # Диапазоны (условие, параметры) по порядку выдачи; каждый — поиск по индексу
+        ranges: List[Tuple[Optional[str], List[Any]]] = []
+        if after is None:
+            ranges.append((None, []))
+        elif sort_column == "id":
+            ranges.append((f"id {'<' if descending else '>'} ?", [after[1]]))
+        elif after[0] is None and descending:
+            ranges.append((f"{sort_column} IS NULL AND id < ?", [after[1]]))
+        elif after[0] is None:
+            ranges.append((f"{sort_column} IS NULL AND id > ?", [after[1]]))
+            ranges.append((f"{sort_column} IS NOT NULL", []))
+        elif descending:
+            ranges.append((f"({sort_column}, id) < (?, ?)", [after[0], after[1]]))
+            ranges.append((f"{sort_column} IS NULL", []))
+        else:
+            ranges.append((f"({sort_column}, id) > (?, ?)", [after[0], after[1]]))
+
+        if sort_column == "id":
+            order_by = f" ORDER BY id {order} LIMIT ?"
+        else:
+            order_by = f" ORDER BY {sort_column} {order}, id {order} LIMIT ?"
+
+        rows: List[QuestRow] = []
+        cur = self.conn.cursor()
+        for condition, params in ranges:
+            where = base_where + ([condition] if condition else [])
+            sql = "SELECT id, title, difficulty, reward, deadline, created_at FROM quests"
+            if where:
+                sql += " WHERE " + " AND ".join(where)
+            cur.execute(sql + order_by, base_params + params + [limit - len(rows)])
+            rows.extend(tuple(row) for row in cur.fetchall())
+            if len(rows) >= limit:
+                break
+        return rows
+
+    def get_upcoming_deadlines(
+        self,
+        after: Tuple[int, int],
+        limit: int = 64,
+    ) -> List[DeadlineRow]:
+        """Ближайшие дедлайны строго после (epoch, id), по индексу."""
+        cur = self.conn.cursor()
+        cur.execute(
+            """
+            SELECT deadline_epoch, id, title FROM quests
+            WHERE deadline_epoch IS NOT NULL AND (deadline_epoch, id) > (?, ?)
+            ORDER BY deadline_epoch, id LIMIT ?
+            """,
+            (after[0], after[1], limit),
+        )
+        return [tuple(row) for row in cur.fetchall()]
+
     # ---------- Локации карты ----------
 
     def add_location(
@@ -177,3 +373,41 @@ class Database:
             (quest_id,),
         )
         return [dict(row) for row in cur.fetchall()]
+
+    # ---------- Достижения ----------
+
+    def add_achievements(self, texts: List[str]) -> None:
+        """Пишем пачку достижений одной транзакцией."""
+        if not texts:
+            return
+        cur = self.conn.cursor()
+        cur.executemany(
+            "INSERT INTO achievements (text) VALUES (?)",
+            [(text,) for text in texts],
+        )
+        self.conn.commit()
+
+    def get_achievements(
+        self,
+        limit: int = 50,
+        before_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Страница истории достижений, от новых к старым.
+
+        Следующую страницу запрашиваем с before_id = id последней строки.
+        """
+        cur = self.conn.cursor()
+        if before_id is None:
+            cur.execute(
+                "SELECT id, text, created_at FROM achievements ORDER BY id DESC LIMIT ?",
+                (limit,),
+            )
+        else:
+            cur.execute(
+                """
+                SELECT id, text, created_at FROM achievements
+                WHERE id < ? ORDER BY id DESC LIMIT ?
+                """,
+                (before_id, limit),
+            )
+        return [dict(row) for row in cur.fetchall()]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import heapq
+import time
+from typing import List, Optional, Tuple
+
+from core.database import Database, DeadlineRow
+
+
+# Сколько ближайших дедлайнов держим в куче
+HEAP_CAPACITY = 64
+
+
+class DeadlineScheduler:
+    """Мин-куча ближайших N дедлайнов, пополняемая индексным запросом.
+
+    В памяти только HEAP_CAPACITY строк независимо от числа квестов; когда
+    куча пустеет, следующая порция берётся keyset-запросом после последней
+    загруженной строки.
+    """
+
+    def __init__(self, db: Database, capacity: int = HEAP_CAPACITY) -> None:
+        self.db = db
+        self.capacity = capacity
+        self._heap: List[DeadlineRow] = []
+        # Ключ (epoch, id) последней загруженной строки
+        self._cursor: Tuple[int, int] = (0, 0)
+        self._exhausted = False
+        self.reset()
+
+    def reset(self, now: Optional[float] = None) -> None:
+        """Перечитывает расписание с текущего момента (после правки дедлайна)."""
+        now = time.time() if now is None else now
+        self._heap = []
+        # Просроченные до запуска не напоминаем
+        self._cursor = (int(now), 2 ** 63 - 1)
+        self._exhausted = False
+        self._refill()
+
+    def _refill(self) -> None:
+        if self._exhausted:
+            return
+        rows = self.db.get_upcoming_deadlines(self._cursor, self.capacity)
+        if len(rows) < self.capacity:
+            self._exhausted = True
+        if rows:
+            self._cursor = (rows[-1][0], rows[-1][1])
+            # Строки уже отсортированы — это корректная куча
+            self._heap.extend(rows)
+            heapq.heapify(self._heap)
+
+    def next_due(self) -> Optional[int]:
+        """Epoch ближайшего дедлайна или None."""
+        if not self._heap:
+            self._refill()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: Optional[float] = None) -> List[DeadlineRow]:
+        """Забирает все наступившие дедлайны."""
+        now = time.time() if now is None else now
+        due: List[DeadlineRow] = []
+        while True:
+            if not self._heap:
+                self._refill()
+                if not self._heap:
+                    break
+            if self._heap[0][0] > now:
+                break
+            due.append(heapq.heappop(self._heap))
+        return due
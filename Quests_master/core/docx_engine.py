@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import io
+import re
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+
+# Заготовки .docx лежат рядом с HTML-шаблонами: templates/docx/<стиль>.docx
+DOCX_SKELETONS_DIR = Path(__file__).resolve().parent.parent / "templates" / "docx"
+
+DOCUMENT_PART = "word/document.xml"
+
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+# Управляющие символы, недопустимые в XML 1.0
+_INVALID_XML_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+# Разрыв раздела с новой страницы между квестами в общем документе
+_SECTION_BREAK = '<w:p><w:pPr>{sect_pr}</w:pPr></w:p>'
+
+
+def _escape(value: Any) -> str:
+    text = _INVALID_XML_RE.sub("", "" if value is None else str(value))
+    text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    # Переносы строк описания превращаем в <w:br/> внутри того же прогона
+    return text.replace("\n", '</w:t><w:br/><w:t xml:space="preserve">')
+
+
+class DocxSkeleton:
+    """Заготовка .docx, разобранная один раз.
+
+    Статические части (стили, связи, свойства) сжимаются один раз в «префиксный»
+    zip; на каждый документ копируются его байты и дописывается только
+    word/document.xml с подставленными полями квеста.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with zipfile.ZipFile(path) as src:
+            document_xml = src.read(DOCUMENT_PART).decode("utf-8")
+            prefix = io.BytesIO()
+            with zipfile.ZipFile(prefix, "w", zipfile.ZIP_DEFLATED) as dst:
+                for info in src.infolist():
+                    if info.filename != DOCUMENT_PART:
+                        dst.writestr(info, src.read(info))
+        self._static_zip = prefix.getvalue()
+
+        # document.xml = head + <w:body> + тело квеста + sectPr + </w:body> + tail
+        body_start = document_xml.index("<w:body>") + len("<w:body>")
+        sect_start = document_xml.rindex("<w:sectPr")
+        body_end = document_xml.rindex("</w:body>")
+        self._head = document_xml[:body_start]
+        self._sect_pr = document_xml[sect_start:body_end]
+        self._tail = document_xml[body_end:]
+        # Чётные элементы — литералы, нечётные — имена полей
+        self._body_parts = _PLACEHOLDER_RE.split(document_xml[body_start:sect_start])
+
+    def _fields(self, quest: Dict[str, Any], now: datetime) -> Dict[str, str]:
+        fields = {key: _escape(value) for key, value in quest.items()}
+        fields["now"] = now.strftime("%Y-%m-%d %H:%M")
+        fields["now_date"] = now.strftime("%Y-%m-%d")
+        return fields
+
+    def _fill_body(self, fields: Dict[str, str]) -> str:
+        parts = self._body_parts
+        out: List[str] = []
+        for i, part in enumerate(parts):
+            out.append(fields.get(part, "") if i % 2 else part)
+        return "".join(out)
+
+    def render_xml(self, quests: Iterable[Dict[str, Any]], now: Optional[datetime] = None) -> str:
+        """document.xml: по разделу с новой страницы на каждый квест."""
+        now = now or datetime.now()
+        section_break = _SECTION_BREAK.format(sect_pr=self._sect_pr)
+        bodies = [self._fill_body(self._fields(quest, now)) for quest in quests]
+        return self._head + section_break.join(bodies) + self._sect_pr + self._tail
+
+    def build(self, quests: Iterable[Dict[str, Any]], now: Optional[datetime] = None) -> bytes:
+        buf = io.BytesIO(self._static_zip)
+        with zipfile.ZipFile(buf, "a", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr(DOCUMENT_PART, self.render_xml(quests, now))
+        return buf.getvalue()
+
+    def write(
+        self,
+        quests: Iterable[Dict[str, Any]],
+        output_path: Path,
+        now: Optional[datetime] = None,
+    ) -> None:
+        Path(output_path).write_bytes(self.build(quests, now))
+
+
+class DocxEngine:
+    """Кэш заготовок по стилю (имени HTML-шаблона)."""
+
+    def __init__(self, skeletons_dir: Path = DOCX_SKELETONS_DIR) -> None:
+        self.skeletons_dir = skeletons_dir
+        self._skeletons: Dict[str, DocxSkeleton] = {}
+
+    def skeleton(self, template_name: str) -> DocxSkeleton:
+        style = Path(template_name).stem
+        skeleton = self._skeletons.get(style)
+        if skeleton is None:
+            path = self.skeletons_dir / f"{style}.docx"
+            if not path.exists():
+                raise FileNotFoundError(f"No DOCX skeleton for template: {template_name}")
+            skeleton = self._skeletons[style] = DocxSkeleton(path)
+        return skeleton
+
+    def export(self, quest: Dict[str, Any], output_path: Path, template_name: str) -> None:
+        self.skeleton(template_name).write([quest], output_path)
+
+    def export_many(
+        self,
+        quests: Iterable[Dict[str, Any]],
+        output_path: Path,
+        template_name: str,
+    ) -> None:
+        """Много квестов в одном документе, каждый — отдельный раздел."""
+        self.skeleton(template_name).write(quests, output_path)
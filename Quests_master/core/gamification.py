@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Deque, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from core.database import Database
 
 
 LEVELS: Dict[str, int] = {
@@ -17,17 +21,39 @@ EVENT_XP: Dict[str, int] = {
     "boss_fight": 20,
 }
 
+# Сколько последних достижений держим в памяти; полная история — в БД.
+ACHIEVEMENTS_LIMIT = 20
+
+
+def _achievements_buffer() -> Deque[str]:
+    return deque(maxlen=ACHIEVEMENTS_LIMIT)
+
 
 @dataclass
 class XPState:
     xp: int = 0
     level: str = "Ученик"
-    achievements: List[str] = field(default_factory=list)
+    # Кольцевой буфер: старые записи вытесняются автоматически
+    achievements: Deque[str] = field(default_factory=_achievements_buffer)
+
+
+@dataclass
+class XPUpdate:
+    """Итог пачки событий: одно обновление вместо N."""
+
+    xp: int
+    level: str
+    gained_xp: int = 0
+    events: int = 0
+    level_ups: List[str] = field(default_factory=list)
+    # Включая «Новый уровень: …» — в том же порядке, что и в БД
+    new_achievements: List[str] = field(default_factory=list)
 
 
 class XPManager:
-    def __init__(self) -> None:
+    def __init__(self, db: Optional[Database] = None) -> None:
         self.state = XPState()
+        self.db = db
 
     def _recalculate_level(self) -> None:
         level = "Ученик"
@@ -38,13 +64,36 @@ class XPManager:
 
     def add_event(self, event: str) -> Tuple[int, str]:
         """Добавляет XP за событие, возвращает (новый_xp, уровень)."""
-        delta = EVENT_XP.get(event, 0)
-        self.state.xp += delta
-        self._recalculate_level()
-        if delta > 0:
-            self.state.achievements.append(f"+{delta} XP: {event}")
+        self.add_events([event])
         return self.state.xp, self.state.level
 
+    def add_events(self, events: Iterable[str]) -> XPUpdate:
+        """Добавляет XP за пачку событий; в БД пишем одной транзакцией."""
+        start_xp = self.state.xp
+        update = XPUpdate(xp=start_xp, level=self.state.level)
+        for event in events:
+            update.events += 1
+            delta = EVENT_XP.get(event, 0)
+            if delta <= 0:
+                continue
+            prev_level = self.state.level
+            self.state.xp += delta
+            self._recalculate_level()
+            texts = [f"+{delta} XP: {event}"]
+            if self.state.level != prev_level:
+                update.level_ups.append(self.state.level)
+                texts.append(f"Новый уровень: {self.state.level}")
+            self.state.achievements.extend(texts)
+            update.new_achievements.extend(texts)
+
+        if self.db is not None and update.new_achievements:
+            self.db.add_achievements(update.new_achievements)
+
+        update.xp = self.state.xp
+        update.level = self.state.level
+        update.gained_xp = self.state.xp - start_xp
+        return update
+
     def get_progress_to_next_level(self) -> int:
         """Процент заполнения для QProgressBar."""
         current_xp = self.state.xp
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+# weasyprint импортируется при создании сессии, а не при импорте модуля
+
+
+_STYLE_RE = re.compile(r"<style[^>]*>(.*?)</style>", re.DOTALL | re.IGNORECASE)
+
+
+def _font_configuration() -> Any:
+    try:
+        from weasyprint.text.fonts import FontConfiguration
+    except ImportError:  # weasyprint < 53
+        from weasyprint.fonts import FontConfiguration
+    return FontConfiguration()
+
+
+class PdfSession:
+    """Долгоживущая сессия WeasyPrint.
+
+    CSS каждого шаблона и FontConfiguration разбираются один раз; из
+    отрендеренного HTML встроенный <style> вырезается и подставляется уже
+    разобранная таблица стилей. @font-face шаблонов ссылается на
+    assets/fonts/UncialAntiqua-Regular.ttf — FontConfiguration регистрирует
+    шрифт один раз, а WeasyPrint сам встраивает в PDF только нужные глифы.
+    Кириллицы в Uncial Antiqua нет: русский текст берётся из системного serif.
+    """
+
+    def __init__(self, templates_dir: Path) -> None:
+        self.templates_dir = templates_dir
+        self.base_url = templates_dir.as_uri() + "/"
+        self.font_config = _font_configuration()
+        self._stylesheets: Dict[str, Any] = {}
+
+    def stylesheet(self, template_name: str) -> Any:
+        css = self._stylesheets.get(template_name)
+        if css is None:
+            from weasyprint import CSS
+
+            source = (self.templates_dir / template_name).read_text(encoding="utf-8")
+            css = CSS(
+                string="\n".join(_STYLE_RE.findall(source)),
+                base_url=self.base_url,
+                font_config=self.font_config,
+            )
+            self._stylesheets[template_name] = css
+        return css
+
+    def render_document(self, html: str, template_name: str) -> Any:
+        from weasyprint import HTML
+
+        stripped = _STYLE_RE.sub("", html)
+        return HTML(string=stripped, base_url=self.base_url).render(
+            stylesheets=[self.stylesheet(template_name)],
+            font_config=self.font_config,
+        )
+
+    def write_pdf(self, html: str, template_name: str, output_path: Path) -> None:
+        self.render_document(html, template_name).write_pdf(str(output_path))
+
+    def write_combined(
+        self,
+        documents: Iterable[Tuple[str, str]],
+        output_path: Path,
+    ) -> int:
+        """Один PDF из многих квестов: страницы каждого идут подряд.
+
+        documents — пары (html, template_name). Возвращает число страниц.
+        """
+        rendered = [self.render_document(html, name) for html, name in documents]
+        if not rendered:
+            raise ValueError("No documents to write")
+        pages: List[Any] = [page for doc in rendered for page in doc.pages]
+        rendered[0].copy(pages).write_pdf(str(output_path))
+        return len(pages)
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import bisect
+import functools
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+
+# Включается флагом --profile или переменной окружения
+PROFILE_ENV = "QUEST_MASTER_PROFILE"
+
+# Верхние границы корзин гистограммы, мс (последняя — «всё остальное»)
+HISTOGRAM_BOUNDS_MS: List[float] = [0.1, 0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000]
+
+# Сколько последних вызовов храним для экспорта трассы
+TRACE_LIMIT = 100_000
+
+
+@dataclass
+class CallStats:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(HISTOGRAM_BOUNDS_MS) + 1))
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.buckets[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, seconds * 1000)] += 1
+
+    def percentile(self, q: float) -> float:
+        """Оценка перцентиля по гистограмме (верхняя граница корзины), мс."""
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                if i < len(HISTOGRAM_BOUNDS_MS):
+                    return min(HISTOGRAM_BOUNDS_MS[i], self.max * 1000)
+                return self.max * 1000
+        return self.max * 1000
+
+
+class Profiler:
+    """Гистограммы задержек и счётчики по именованным точкам."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.stats: Dict[str, CallStats] = {}
+        self.counters: Dict[str, int] = {}
+        # (имя, начало, длительность, поток) для Chrome trace
+        self.trace: Deque[Tuple[str, float, float, int]] = deque(maxlen=TRACE_LIMIT)
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def record(self, name: str, start: float, seconds: float) -> None:
+        with self._lock:
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = CallStats()
+            stats.add(seconds)
+            self.trace.append((name, start, seconds, threading.get_ident()))
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stats.clear()
+            self.counters.clear()
+            self.trace.clear()
+            self._origin = time.perf_counter()
+
+    # ---------- Отчёты ----------
+
+    def report(self) -> str:
+        """Текстовая сводка: для вкладки диагностики и дампа в консоль."""
+        lines = [
+            f"{'точка':<48} {'вызовов':>8} {'всего, мс':>10} {'ср., мс':>8} "
+            f"{'p95, мс':>8} {'макс, мс':>9}"
+        ]
+        with self._lock:
+            items = sorted(self.stats.items(), key=lambda kv: kv[1].total, reverse=True)
+            counters = sorted(self.counters.items())
+        for name, s in items:
+            lines.append(
+                f"{name[:48]:<48} {s.count:>8} {s.total * 1000:>10.1f} "
+                f"{s.total / s.count * 1000:>8.2f} {s.percentile(0.95):>8.1f} "
+                f"{s.max * 1000:>9.1f}"
+            )
+        if counters:
+            lines.append("")
+            for name, n in counters:
+                lines.append(f"{name:<48} {n:>8}")
+        return "\n".join(lines)
+
+    def export_chrome_trace(self, path: Path) -> None:
+        """JSON в формате Trace Event: chrome://tracing, Perfetto, speedscope."""
+        with self._lock:
+            spans = list(self.trace)
+            origin = self._origin
+        pid = os.getpid()
+        events = [
+            {
+                "name": name,
+                "ph": "X",
+                "ts": (start - origin) * 1e6,
+                "dur": seconds * 1e6,
+                "pid": pid,
+                "tid": tid,
+            }
+            for name, start, seconds, tid in spans
+        ]
+        Path(path).write_text(json.dumps({"traceEvents": events}), encoding="utf-8")
+
+
+profiler = Profiler()
+
+
+def timed(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    """Оборачивает функцию замером времени (пока профилировщик включён)."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not profiler.enabled:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.record(name, start, time.perf_counter() - start)
+
+    wrapper.__profiled__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def instrument_methods(cls: type, names: Iterable[str], prefix: Optional[str] = None) -> None:
+    """Подменяет методы класса обёртками timed (повторный вызов безопасен)."""
+    prefix = prefix or cls.__name__
+    for name in names:
+        method = getattr(cls, name)
+        if getattr(method, "__profiled__", False):
+            continue
+        setattr(cls, name, timed(f"{prefix}.{name}", method))
+
+
+# ---------- SQL ----------
+
+_WS_RE = re.compile(r"\s+")
+
+
+def _sql_key(sql: str) -> str:
+    return "sql: " + _WS_RE.sub(" ", sql).strip()[:80]
+
+
+class ProfiledCursor(sqlite3.Cursor):
+    """Замеряет execute (первый шаг запроса) и fetch* отдельно.
+
+    Для SELECT execute выполняет только первый шаг, остальное время уходит
+    в fetchone/fetchmany/fetchall — оно пишется в точку «<sql> [fetch]».
+    Итерация курсором (for row in cur) не замеряется.
+    """
+
+    _profile_key = ""
+
+    def execute(self, sql: str, parameters: Any = (), /) -> ProfiledCursor:  # type: ignore[override]
+        if not profiler.enabled:
+            return super().execute(sql, parameters)
+        self._profile_key = _sql_key(sql)
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            profiler.record(self._profile_key, start, time.perf_counter() - start)
+
+    def _timed_fetch(self, fetch: Callable[..., Any], *args: Any) -> Any:
+        if not profiler.enabled or not self._profile_key:
+            return fetch(*args)
+        start = time.perf_counter()
+        try:
+            return fetch(*args)
+        finally:
+            profiler.record(
+                f"{self._profile_key} [fetch]", start, time.perf_counter() - start
+            )
+
+    def fetchone(self) -> Any:
+        return self._timed_fetch(super().fetchone)
+
+    def fetchmany(self, size: int = 1) -> List[Any]:  # type: ignore[override]
+        return self._timed_fetch(super().fetchmany, size)
+
+    def fetchall(self) -> List[Any]:
+        return self._timed_fetch(super().fetchall)
+
+    def executemany(self, sql: str, seq_of_parameters: Any, /) -> ProfiledCursor:  # type: ignore[override]
+        if not profiler.enabled:
+            return super().executemany(sql, seq_of_parameters)
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            profiler.record(_sql_key(sql), start, time.perf_counter() - start)
+
+
+class ProfiledConnection(sqlite3.Connection):
+    """Соединение, курсоры которого замеряют каждый SQL-запрос."""
+
+    def cursor(self, factory: Any = ProfiledCursor) -> sqlite3.Cursor:  # type: ignore[override]
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters: Any = (), /) -> sqlite3.Cursor:  # type: ignore[override]
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Any, /) -> sqlite3.Cursor:  # type: ignore[override]
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def commit(self) -> None:
+        if not profiler.enabled:
+            return super().commit()
+        start = time.perf_counter()
+        try:
+            super().commit()
+        finally:
+            profiler.count("sqlite.commits")
+            profiler.record("sqlite.commit", start, time.perf_counter() - start)
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> Any:
+        # «with conn:» коммитит в C-коде, минуя commit() выше
+        if not profiler.enabled or exc_type is not None or not self.in_transaction:
+            return super().__exit__(exc_type, exc, tb)
+        start = time.perf_counter()
+        try:
+            return super().__exit__(exc_type, exc, tb)
+        finally:
+            profiler.count("sqlite.commits")
+            profiler.record("sqlite.commit", start, time.perf_counter() - start)
+
+
+# ---------- Установка ----------
+
+DATABASE_METHODS = [
+    "create_draft_quest",
+    "update_quest_field",
+    "get_quest",
+    "get_quest_as_dict",
+    "list_quests_page",
+    "get_upcoming_deadlines",
+    "backfill_deadline_epochs",
+    "add_location",
+    "get_locations_for_quest",
+    "add_achievements",
+    "get_achievements",
+]
+
+TEMPLATE_ENGINE_METHODS = [
+    "render",
+    "export_pdf",
+    "export_pdf_many",
+    "export_docx",
+    "export_docx_fast",
+    "export_docx_many",
+]
+
+
+def install() -> None:
+    """Включает профилирование и инструментирует core.
+
+    Вызывать до создания Database: соединение получает ProfiledConnection.
+    """
+    from core.database import Database
+    from core.template_engine import TemplateEngine
+
+    profiler.enabled = True
+    Database.connection_factory = ProfiledConnection
+    instrument_methods(Database, DATABASE_METHODS)
+    instrument_methods(TemplateEngine, TEMPLATE_ENGINE_METHODS)
+
+
+def enabled_from_env() -> bool:
+    return os.environ.get(PROFILE_ENV, "") not in ("", "0")
@@ -7,6 +7,9 @@ from typing import Any, Dict, List, Optional
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
+from core.docx_engine import DocxEngine
+from core.pdf_session import PdfSession
+
 
 
 # weasyprint и python-docx импортируются там, где реально нужны,
@@ -22,6 +25,7 @@ PARCHMENTS_DIR.mkdir(exist_ok=True)
 class RenderResult:
     html: str
     qr_path: Optional[Path]
+    template_name: str = ""
 
 
 class TemplateEngine:
@@ -30,6 +34,9 @@ class TemplateEngine:
             loader=FileSystemLoader(str(templates_dir)),
             autoescape=select_autoescape(["html", "xml"]),
         )
+        self.templates_dir = templates_dir
+        self.docx_engine = DocxEngine()
+        self._pdf_session: Optional[PdfSession] = None
 
     def _generate_qr(self, quest_id: int) -> Optional[Path]:
 
@@ -49,12 +56,29 @@ class TemplateEngine:
             now=datetime.now(),
             qr_code_path=str(qr_path) if qr_path else None,
         )
-        return RenderResult(html=html, qr_path=qr_path)
+        return RenderResult(html=html, qr_path=qr_path, template_name=template_name)
 
-    def export_pdf(self, render: RenderResult, output_path: Path) -> None:
-        from weasyprint import HTML  # локальный импорт
+    @property
+    def pdf_session(self) -> PdfSession:
+        """Одна сессия WeasyPrint на движок: CSS и шрифты разбираются один раз."""
+        if self._pdf_session is None:
+            self._pdf_session = PdfSession(self.templates_dir)
+        return self._pdf_session
 
-        HTML(string=render.html).write_pdf(str(output_path))
+    def export_pdf(self, render: RenderResult, output_path: Path) -> None:
+        if not render.template_name:
+            from weasyprint import HTML  # локальный импорт
+
+            HTML(string=render.html).write_pdf(str(output_path))
+            return
+        self.pdf_session.write_pdf(render.html, render.template_name, output_path)
+
+    def export_pdf_many(self, renders: List[RenderResult], output_path: Path) -> int:
+        """Буклет кампании: все квесты в одном PDF. Возвращает число страниц."""
+        return self.pdf_session.write_combined(
+            ((r.html, r.template_name) for r in renders),
+            output_path,
+        )
 
     def export_docx(self, quest: Dict[str, Any], output_path: Path) -> None:
         from docx import Document  # локальный импорт
@@ -70,6 +94,24 @@ class TemplateEngine:
         doc.add_paragraph(f"Создано: {quest['created_at']}")
         doc.save(str(output_path))
 
+    def export_docx_fast(
+        self,
+        quest: Dict[str, Any],
+        output_path: Path,
+        template_name: str = "guild_contract.html",
+    ) -> None:
+        """DOCX из заготовки templates/docx/<стиль>.docx, без python-docx."""
+        self.docx_engine.export(quest, output_path, template_name)
+
+    def export_docx_many(
+        self,
+        quests: List[Dict[str, Any]],
+        output_path: Path,
+        template_name: str = "guild_contract.html",
+    ) -> None:
+        """Все квесты в одном DOCX, каждый с новой страницы."""
+        self.docx_engine.export_many(quests, output_path, template_name)
+
     @staticmethod
     def default_output_path(quest_id: int, ext: str) -> Path:
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Optional
+
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+
+from core.backup import BACKUP_DIR, BackupCancelled, backup_database
+
+
+class BackupThread(QThread):
+    """Онлайн-бэкап в фоне: GUI и автосохранение продолжают работать."""
+
+    progress = pyqtSignal(int, int)  # скопировано страниц, всего
+    completed = pyqtSignal(object)  # BackupResult
+    failed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        db_path: Path,
+        dest_dir: Path = BACKUP_DIR,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.db_path = db_path
+        self.dest_dir = dest_dir
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        """Просит прервать бэкап после текущей пачки страниц."""
+        self._cancel.set()
+
+    def run(self) -> None:
+        try:
+            result = backup_database(
+                self.db_path,
+                self.dest_dir,
+                progress=self.progress.emit,
+                cancelled=self._cancel.is_set,
+            )
+        except BackupCancelled:
+            return
+        except Exception as exc:  # noqa: BLE001 — показываем пользователю
+            self.failed.emit(str(exc))
+            return
+        self.completed.emit(result)
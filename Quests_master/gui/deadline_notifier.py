@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from core.database import Database
+from core.deadlines import DeadlineScheduler
+
+
+# Дольше не спим: переживаем смену системного времени и сон ноутбука
+MAX_SLEEP_MS = 60 * 60 * 1000
+RESCHEDULE_DELAY_MS = 500
+
+
+class DeadlineNotifier(QObject):
+    """Один таймер на ближайший дедлайн вместо опроса всех квестов."""
+
+    deadline_due = pyqtSignal(int, str)  # quest_id, title
+
+    def __init__(self, db: Database, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.scheduler = DeadlineScheduler(db)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timeout)
+
+        # Правки дедлайна приходят пачкой (прокрутка QDateTimeEdit) — перечитываем один раз
+        self._reset_timer = QTimer(self)
+        self._reset_timer.setSingleShot(True)
+        self._reset_timer.setInterval(RESCHEDULE_DELAY_MS)
+        self._reset_timer.timeout.connect(self._reset)
+
+        self._arm()
+
+    def deadlines_changed(self, *_args) -> None:
+        self._reset_timer.start()
+
+    def _reset(self) -> None:
+        self.scheduler.reset()
+        self._arm()
+
+    def _arm(self) -> None:
+        due = self.scheduler.next_due()
+        if due is None:
+            self._timer.stop()
+            return
+        delay_ms = max(0, int((due - time.time()) * 1000))
+        self._timer.start(min(delay_ms, MAX_SLEEP_MS))
+
+    def _on_timeout(self) -> None:
+        for _epoch, quest_id, title in self.scheduler.pop_due():
+            self.deadline_due.emit(quest_id, title)
+        self._arm()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Optional
+
+from PyQt6.QtCore import QObject, QTimer
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QPlainTextEdit,
+    QPushButton,
+    QFileDialog,
+)
+
+from core.profiling import instrument_methods, profiler
+
+
+# Всё, что дольше, считается зависанием цикла событий
+STALL_THRESHOLD_MS = 50
+HEARTBEAT_MS = 10
+
+MAP_VIEW_METHODS = [
+    "mousePressEvent",
+    "mouseMoveEvent",
+    "mouseReleaseEvent",
+    "_draw_point",
+    "_add_marker",
+    "_add_text",
+    "_scene_to_image",
+    "load_background",
+]
+
+
+def install_gui_hooks() -> None:
+    """Инструментирует обработчики редактора карты."""
+    from gui.map_editor import MapView
+
+    instrument_methods(MapView, MAP_VIEW_METHODS)
+
+
+class StallMonitor(QObject):
+    """Пульс раз в HEARTBEAT_MS: опоздание таймера = время зависания цикла."""
+
+    def __init__(
+        self,
+        threshold_ms: int = STALL_THRESHOLD_MS,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.threshold = threshold_ms / 1000
+        self._last = time.perf_counter()
+        self._timer = QTimer(self)
+        self._timer.setInterval(HEARTBEAT_MS)
+        self._timer.timeout.connect(self._beat)
+
+    def start(self) -> None:
+        self._last = time.perf_counter()
+        self._timer.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    def _beat(self) -> None:
+        now = time.perf_counter()
+        stall = now - self._last - HEARTBEAT_MS / 1000
+        self._last = now
+        if stall > self.threshold:
+            profiler.count("qt.stalls")
+            profiler.record("qt.event_loop_stall", now - stall, stall)
+
+
+class DiagnosticsPanel(QWidget):
+    """Скрытая вкладка: сводка профилировщика и экспорт трассы."""
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._build_ui()
+
+    def _build_ui(self) -> None:
+        layout = QVBoxLayout(self)
+
+        self.report_view = QPlainTextEdit()
+        self.report_view.setReadOnly(True)
+        self.report_view.setFont(QFont("Monospace", 9))
+
+        buttons = QHBoxLayout()
+        refresh_button = QPushButton("Обновить")
+        reset_button = QPushButton("Сбросить")
+        export_button = QPushButton("Экспорт трассы")
+        refresh_button.clicked.connect(self.refresh)
+        reset_button.clicked.connect(self._on_reset)
+        export_button.clicked.connect(self._on_export)
+        buttons.addWidget(refresh_button)
+        buttons.addWidget(reset_button)
+        buttons.addWidget(export_button)
+
+        layout.addLayout(buttons)
+        layout.addWidget(self.report_view)
+
+    def refresh(self) -> None:
+        self.report_view.setPlainText(profiler.report())
+
+    def showEvent(self, event) -> None:
+        self.refresh()
+        super().showEvent(event)
+
+    def _on_reset(self) -> None:
+        profiler.reset()
+        self.refresh()
+
+    def _on_export(self) -> None:
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Экспорт трассы",
+            "quest_master_trace.json",
+            "Chrome Trace (*.json)",
+        )
+        if not file_path:
+            return
+        profiler.export_chrome_trace(Path(file_path))
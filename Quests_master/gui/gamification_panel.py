@@ -1,12 +1,48 @@
 from __future__ import annotations
 
-from typing import List
+from collections import deque
+from typing import Any, Deque, List, Optional
 
-from PyQt6.QtCore import Qt, QUrl
+from PyQt6.QtCore import Qt, QUrl, QAbstractListModel, QModelIndex
 from PyQt6.QtMultimedia import QSoundEffect
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QProgressBar, QListWidget
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QProgressBar, QListView
 
-from core.gamification import XPState
+from core.database import Database
+from core.gamification import ACHIEVEMENTS_LIMIT, XPUpdate
+
+
+class AchievementsModel(QAbstractListModel):
+    """Последние достижения; строки добавляются/вытесняются по одной."""
+
+    def __init__(self, limit: int = ACHIEVEMENTS_LIMIT, parent: Optional[Any] = None) -> None:
+        super().__init__(parent)
+        self._items: Deque[str] = deque(maxlen=limit)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._items)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._items[index.row()]
+
+    def append_items(self, items: List[str]) -> None:
+        limit = self._items.maxlen or len(items)
+        items = items[-limit:]
+        if not items:
+            return
+        overflow = len(self._items) + len(items) - limit
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self._items.popleft()
+            self.endRemoveRows()
+        first = len(self._items)
+        self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+        self._items.extend(items)
+        self.endInsertRows()
 
 
 class GamificationPanel(QWidget):
@@ -25,7 +61,9 @@ class GamificationPanel(QWidget):
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
 
-        self.achievements_list = QListWidget()
+        self.achievements_model = AchievementsModel(parent=self)
+        self.achievements_list = QListView()
+        self.achievements_list.setModel(self.achievements_model)
 
         layout.addWidget(self.level_label)
         layout.addWidget(self.progress_bar)
@@ -38,13 +76,18 @@ class GamificationPanel(QWidget):
         self.sound.setSource(QUrl.fromLocalFile("assets/icons/xp.wav"))
         self.sound.setVolume(0.5)
 
-    def update_state(self, state: XPState, progress: int) -> None:
-        self.level_label.setText(f"Уровень: {state.level} ({state.xp} XP)")
+    def load_history(self, db: Database) -> None:
+        """Последние достижения из БД — чтобы после перезапуска список не был пуст."""
+        rows = db.get_achievements(limit=ACHIEVEMENTS_LIMIT)
+        self.achievements_model.append_items([row["text"] for row in reversed(rows)])
+
+    def update_state(self, update: XPUpdate, progress: int) -> None:
+        """Одно сводное обновление на пачку событий (их копит XPEventBus)."""
+        self.level_label.setText(f"Уровень: {update.level} ({update.xp} XP)")
         self.progress_bar.setValue(progress)
-        self.achievements_list.clear()
-        for ach in state.achievements[-20:]:
-            self.achievements_list.addItem(ach)
-        self.play_xp_sound()
+        self.achievements_model.append_items(update.new_achievements)
+        if update.gained_xp > 0:
+            self.play_xp_sound()
 
     def play_xp_sound(self) -> None:
         if self.sound.source().isEmpty():
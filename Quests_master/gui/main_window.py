@@ -2,8 +2,12 @@ from __future__ import annotations
 
 from typing import Optional
 
+from PyQt6.QtGui import QAction, QCloseEvent
 from PyQt6.QtWidgets import (
     QMainWindow,
+    QMessageBox,
+    QStyle,
+    QSystemTrayIcon,
     QWidget,
     QTabWidget,
     QVBoxLayout,
@@ -11,10 +15,15 @@ from PyQt6.QtWidgets import (
 
 from core.database import Database
 from core.template_engine import TemplateEngine
-from core.gamification import XPManager
+from core.gamification import XPManager, XPUpdate
+from core.profiling import profiler
 from gui.quest_wizard import QuestWizard
 from gui.map_editor import MapEditor
 from gui.gamification_panel import GamificationPanel
+from gui.quest_browser import QuestBrowser
+from gui.xp_event_bus import XPEventBus
+from gui.backup_worker import BackupThread
+from gui.deadline_notifier import DeadlineNotifier
 
 
 class MainWindow(QMainWindow):
@@ -26,9 +35,18 @@ class MainWindow(QMainWindow):
 
         self.db = Database()
         self.template_engine = TemplateEngine()
-        self.xp_manager = XPManager()
+        self.xp_manager = XPManager(self.db)
+        self.xp_bus = XPEventBus(self.xp_manager, self)
+        self.xp_bus.updated.connect(self._on_xp_update)
+        self.backup_thread: Optional[BackupThread] = None
 
         self._build_ui()
+        self._build_menu()
+        self._init_tray()
+
+        self.deadline_notifier = DeadlineNotifier(self.db, self)
+        self.deadline_notifier.deadline_due.connect(self._on_deadline_due)
+        self.quest_wizard.deadline_changed.connect(self.deadline_notifier.deadlines_changed)
 
     def _build_ui(self) -> None:
         central = QWidget()
@@ -39,30 +57,106 @@ class MainWindow(QMainWindow):
         # Вкладка квестов
         self.quest_wizard = QuestWizard(self.db, self.template_engine, self)
         self.quest_wizard.quest_created.connect(self._on_quest_created)
-        self.quest_wizard.xp_event.connect(self._on_xp_event)
+        self.quest_wizard.xp_event.connect(self.xp_bus.post)
 
         # Вкладка карты
         self.map_editor = MapEditor(self.db, self)
-        self.map_editor.xp_event.connect(self._on_xp_event)
+        self.map_editor.xp_event.connect(self.xp_bus.post)
+
+        # Вкладка со списком всех квестов
+        self.quest_browser = QuestBrowser(self.db, self)
+        self.quest_browser.quest_selected.connect(self._on_quest_selected)
 
         # Вкладка геймификации
         self.gamification_panel = GamificationPanel(self)
+        self.gamification_panel.load_history(self.db)
 
         self.tabs.addTab(self.quest_wizard, "Квесты")
+        self.tabs.addTab(self.quest_browser, "Все квесты")
         self.tabs.addTab(self.map_editor, "Карта")
         self.tabs.addTab(self.gamification_panel, "Прогресс")
 
+        # Вкладка диагностики — только при включённом профилировании
+        if profiler.enabled:
+            from gui.diagnostics import DiagnosticsPanel, StallMonitor
+
+            self.diagnostics_panel = DiagnosticsPanel(self)
+            self.tabs.addTab(self.diagnostics_panel, "Диагностика")
+            self.stall_monitor = StallMonitor(parent=self)
+            self.stall_monitor.start()
+
         main_layout.addWidget(self.tabs)
         self.setCentralWidget(central)
 
         # Изначально привязываем карту к текущему квесту
         self.map_editor.set_quest(self.quest_wizard.quest_id)
 
+    def _build_menu(self) -> None:
+        file_menu = self.menuBar().addMenu("Файл")
+        self.backup_action = QAction("Резервная копия БД", self)
+        self.backup_action.triggered.connect(self._on_backup)
+        file_menu.addAction(self.backup_action)
+
+    def _init_tray(self) -> None:
+        # Уведомления о дедлайнах — через системный трей, если он есть
+        self.tray_icon: Optional[QSystemTrayIcon] = None
+        if not QSystemTrayIcon.isSystemTrayAvailable():
+            return
+        # Своей иконки у приложения нет, а с пустой иконкой трей не показывается
+        icon = self.windowIcon()
+        if icon.isNull():
+            icon = self.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxInformation)
+        self.tray_icon = QSystemTrayIcon(icon, self)
+        self.tray_icon.setToolTip(self.windowTitle())
+        self.tray_icon.show()
+
+    # ---------- Резервная копия ----------
+
+    def _on_backup(self) -> None:
+        self.backup_action.setEnabled(False)
+        self.backup_thread = BackupThread(self.db.db_path, parent=self)
+        self.backup_thread.progress.connect(self._on_backup_progress)
+        self.backup_thread.completed.connect(self._on_backup_completed)
+        self.backup_thread.failed.connect(self._on_backup_failed)
+        self.backup_thread.finished.connect(lambda: self.backup_action.setEnabled(True))
+        self.backup_thread.start()
+
+    def _on_backup_progress(self, done: int, total: int) -> None:
+        percent = int(done / total * 100) if total else 100
+        self.statusBar().showMessage(f"Резервная копия: {percent}%")
+
+    def _on_backup_completed(self, result) -> None:
+        self.statusBar().showMessage(f"Резервная копия готова — {result.summary()}", 10000)
+
+    def _on_backup_failed(self, message: str) -> None:
+        self.statusBar().clearMessage()
+        QMessageBox.warning(self, "Ошибка", f"Не удалось сделать резервную копию: {message}")
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        # Не даём Qt уничтожить работающий QThread: прерываем бэкап и ждём
+        if self.backup_thread is not None and self.backup_thread.isRunning():
+            self.statusBar().showMessage("Прерываем резервное копирование…")
+            self.backup_thread.cancel()
+            self.backup_thread.wait()
+        super().closeEvent(event)
+
+    def _on_deadline_due(self, quest_id: int, title: str) -> None:
+        message = f"Наступил дедлайн квеста #{quest_id} «{title}»"
+        if self.tray_icon is not None:
+            self.tray_icon.showMessage("Дедлайн", message)
+        self.statusBar().showMessage(message, 15000)
+
     def _on_quest_created(self, quest_id: int) -> None:
         # Привязываем редактор карты к этому квесту
         self.map_editor.set_quest(quest_id)
 
-    def _on_xp_event(self, event: str) -> None:
-        self.xp_manager.add_event(event)
+    def _on_quest_selected(self, quest_id: int) -> None:
+        # Открываем выбранный квест в мастере и привязываем к нему карту
+        self.quest_wizard.load_quest(quest_id)
+        self.map_editor.set_quest(quest_id)
+        self.tabs.setCurrentWidget(self.quest_wizard)
+
+    def _on_xp_update(self, update: XPUpdate) -> None:
+        # Одно обновление панели на пачку событий
         progress = self.xp_manager.get_progress_to_next_level()
-        self.gamification_panel.update_state(self.xp_manager.state, progress)
+        self.gamification_panel.update_state(update, progress)
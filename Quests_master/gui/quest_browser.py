@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+from typing import Any, List, Optional, Tuple
+
+from PyQt6.QtCore import (
+    Qt,
+    QAbstractTableModel,
+    QModelIndex,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLineEdit,
+    QPushButton,
+    QTableView,
+    QAbstractItemView,
+)
+
+from core.database import Database, QuestRow, SORTABLE_QUEST_COLUMNS
+
+
+PAGE_SIZE = 200
+# Сколько страниц держим в памяти; дальние от экрана выбрасываются
+WINDOW_PAGES = 5
+SEARCH_DELAY_MS = 250
+
+HEADERS = ["ID", "Название", "Сложность", "Награда", "Дедлайн", "Создан"]
+
+
+class QuestTableModel(QAbstractTableModel):
+    """Ленивая модель-окно: строки подгружаются страницами по мере прокрутки.
+
+    В памяти не больше window_pages страниц. Подгрузка вниз выбрасывает
+    страницы сверху, подгрузка вверх (fetch_previous) — снизу; выброшенные
+    строки при возврате читаются заново keyset-запросом от края окна.
+    """
+
+    # Сдвиг окна: сколько строк добавлено (>0) или убрано (<0) в начале
+    window_shifted = pyqtSignal(int)
+
+    def __init__(
+        self,
+        db: Database,
+        parent: Optional[Any] = None,
+        page_size: int = PAGE_SIZE,
+        window_pages: int = WINDOW_PAGES,
+    ) -> None:
+        super().__init__(parent)
+        self.db = db
+        self.page_size = page_size
+        self.max_rows = page_size * window_pages
+        self._rows: List[QuestRow] = []
+        self._exhausted = False
+        # Есть ли строки перед окном (выброшенные при прокрутке вниз)
+        self._has_previous = False
+        self._sort_column = "id"
+        self._descending = False
+        self._search = ""
+
+    # ---------- Qt API ----------
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._rows[index.row()][index.column()]
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return HEADERS[section]
+        return None
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid() or self._exhausted:
+            return
+        after = self._key(self._rows[-1]) if self._rows else None
+        page = self._page(after, self._descending)
+        if len(page) < self.page_size:
+            self._exhausted = True
+        if not page:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._rows.extend(page)
+        self.endInsertRows()
+
+        overflow = len(self._rows) - self.max_rows
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            del self._rows[:overflow]
+            self.endRemoveRows()
+            self._has_previous = True
+            self.window_shifted.emit(-overflow)
+
+    def can_fetch_previous(self) -> bool:
+        return self._has_previous
+
+    def fetch_previous(self) -> int:
+        """Подгружает страницу перед окном; возвращает число добавленных строк."""
+        if not self._has_previous or not self._rows:
+            return 0
+        # Обратный порядок сортировки от первой строки окна — это строки
+        # перед ней, от ближайшей к дальней
+        page = self._page(self._key(self._rows[0]), not self._descending)
+        if len(page) < self.page_size:
+            self._has_previous = False
+        if not page:
+            return 0
+        page.reverse()
+        self.beginInsertRows(QModelIndex(), 0, len(page) - 1)
+        self._rows[:0] = page
+        self.endInsertRows()
+
+        overflow = len(self._rows) - self.max_rows
+        if overflow > 0:
+            last = len(self._rows)
+            self.beginRemoveRows(QModelIndex(), last - overflow, last - 1)
+            del self._rows[-overflow:]
+            self.endRemoveRows()
+            self._exhausted = False
+        self.window_shifted.emit(len(page))
+        return len(page)
+
+    def _key(self, row: QuestRow) -> Tuple[Any, int]:
+        return row[SORTABLE_QUEST_COLUMNS.index(self._sort_column)], row[0]
+
+    def _page(self, after: Optional[Tuple[Any, int]], descending: bool) -> List[QuestRow]:
+        return self.db.list_quests_page(
+            limit=self.page_size,
+            sort_column=self._sort_column,
+            descending=descending,
+            after=after,
+            search=self._search,
+        )
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        # Сортирует SQLite по индексу, а не Python
+        self._sort_column = SORTABLE_QUEST_COLUMNS[column]
+        self._descending = order == Qt.SortOrder.DescendingOrder
+        self.reload()
+
+    # ---------- Управление ----------
+
+    def set_search(self, text: str) -> None:
+        self._search = text.strip()
+        self.reload()
+
+    def reload(self) -> None:
+        """Сбрасывает загруженные строки и берёт первую страницу заново."""
+        self.beginResetModel()
+        self._rows = []
+        self._exhausted = False
+        self._has_previous = False
+        self.endResetModel()
+        self.fetchMore()
+
+    def quest_id_at(self, row: int) -> int:
+        return self._rows[row][0]
+
+
+class QuestBrowser(QWidget):
+    """Вкладка со списком всех квестов."""
+
+    quest_selected = pyqtSignal(int)
+
+    def __init__(self, db: Database, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.db = db
+        self.model = QuestTableModel(db, self)
+        self._build_ui()
+
+        # Поиск запускаем после паузы в наборе, а не на каждую букву
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(
+            lambda: self.model.set_search(self.search_edit.text())
+        )
+        self.search_edit.textChanged.connect(lambda _: self._search_timer.start())
+
+        # Окно модели сдвигается — держим на экране те же квесты
+        self.model.window_shifted.connect(self._on_window_shifted)
+        self.table.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+
+    def _build_ui(self) -> None:
+        layout = QVBoxLayout(self)
+
+        top_layout = QHBoxLayout()
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Поиск по названию или сложности...")
+        refresh_button = QPushButton("Обновить")
+        refresh_button.clicked.connect(self.model.reload)
+        top_layout.addWidget(self.search_edit)
+        top_layout.addWidget(refresh_button)
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        # Значение полосы прокрутки = номер верхней строки (нужно для сдвига окна)
+        self.table.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerItem)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(0, Qt.SortOrder.DescendingOrder)
+        self.table.doubleClicked.connect(self._on_double_clicked)
+
+        layout.addLayout(top_layout)
+        layout.addWidget(self.table)
+
+    def _on_scrolled(self, value: int) -> None:
+        # Вниз окно подгружает Qt (fetchMore), вверх — мы
+        if value == self.table.verticalScrollBar().minimum() and self.model.can_fetch_previous():
+            self.model.fetch_previous()
+
+    def _on_window_shifted(self, delta: int) -> None:
+        # Полоса прокрутки ещё не пересчитана: rowAt(0) — номер верхней строки до сдвига
+        top = max(0, self.table.rowAt(0)) + delta
+        row = min(max(0, top), self.model.rowCount() - 1)
+        if row < 0:
+            return
+        QTimer.singleShot(0, lambda: self._scroll_to_row(row))
+
+    def _scroll_to_row(self, row: int) -> None:
+        if row < self.model.rowCount():
+            self.table.scrollTo(
+                self.model.index(row, 0), QAbstractItemView.ScrollHint.PositionAtTop
+            )
+
+    def _on_double_clicked(self, index: QModelIndex) -> None:
+        self.quest_selected.emit(self.model.quest_id_at(index.row()))
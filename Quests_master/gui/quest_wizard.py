@@ -29,6 +29,7 @@ from pathlib import Path
 class QuestWizard(QWidget):
     quest_created = pyqtSignal(int)
     xp_event = pyqtSignal(str)  # "create_quest" / "export"
+    deadline_changed = pyqtSignal(int)  # quest_id
 
     def __init__(
         self,
@@ -103,6 +104,38 @@ class QuestWizard(QWidget):
         self.export_pdf_button.clicked.connect(self._on_export_pdf)
         self.export_docx_button.clicked.connect(self._on_export_docx)
 
+    # ---------- Загрузка существующего квеста ----------
+
+    def load_quest(self, quest_id: int) -> None:
+        """Переключает мастер на квест из браузера (без лишних автосохранений)."""
+        quest = self.db.get_quest(quest_id)
+        if quest is None:
+            return
+        self.quest_id = quest.id
+
+        widgets = [
+            self.title_edit,
+            self.difficulty_combo,
+            self.reward_spin,
+            self.description_edit,
+            self.deadline_edit,
+        ]
+        for widget in widgets:
+            widget.blockSignals(True)
+        self.title_edit.setText(quest.title)
+        self.difficulty_combo.setCurrentText(quest.difficulty)
+        self.reward_spin.setValue(quest.reward or 0)
+        self.description_edit.setPlainText(quest.description or "")
+        deadline = QDateTime.fromString(quest.deadline or "", Qt.DateFormat.ISODate)
+        self.deadline_edit.setDateTime(
+            deadline if deadline.isValid() else QDateTime.currentDateTime()
+        )
+        for widget in widgets:
+            widget.blockSignals(False)
+
+        self._update_counter()
+        self._validate_fields()
+
     # ---------- Автосохранение полей ----------
 
     def _on_title_changed(self, text: str) -> None:
@@ -123,6 +156,7 @@ class QuestWizard(QWidget):
 
     def _on_deadline_changed(self, dt: QDateTime) -> None:
         self.db.update_quest_field(self.quest_id, "deadline", dt.toString(Qt.DateFormat.ISODate))
+        self.deadline_changed.emit(self.quest_id)
 
     # ---------- Валидация ----------
 
@@ -207,7 +241,7 @@ class QuestWizard(QWidget):
             )
             if not file_path:
                 return
-            self.template_engine.export_docx(quest, Path(file_path))
+            self.template_engine.export_docx_fast(quest, Path(file_path), "guild_contract.html")
 
         QMessageBox.information(self, "Экспорт", "Экспорт успешно завершён.")
         self.xp_event.emit("export")
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from core.gamification import XPManager, XPUpdate
+
+
+# ~один кадр при 60 FPS
+FRAME_MS = 16
+
+
+class XPEventBus(QObject):
+    """Собирает xp_event-сигналы за кадр и отдаёт одно сводное обновление."""
+
+    updated = pyqtSignal(object)  # XPUpdate
+
+    def __init__(self, xp_manager: XPManager, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.xp_manager = xp_manager
+        self._queue: List[str] = []
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(FRAME_MS)
+        self._timer.timeout.connect(self.flush)
+
+    def post(self, event: str) -> None:
+        """Слот для xp_event из QuestWizard / MapEditor."""
+        self._queue.append(event)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self) -> Optional[XPUpdate]:
+        """Применяет накопленные события сразу (можно вызвать вручную)."""
+        self._timer.stop()
+        if not self._queue:
+            return None
+        events, self._queue = self._queue, []
+        update = self.xp_manager.add_events(events)
+        self.updated.emit(update)
+        return update
@@ -1,29 +1,61 @@
-import sys
-from pathlib import Path
-
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QFontDatabase
-
-from gui.main_window import MainWindow
-
-
-def load_custom_fonts() -> None:
-    """Подключаем Uncial Antiqua из assets/fonts."""
-    fonts_dir = Path(__file__).parent / "assets" / "fonts"
-    font_file = fonts_dir / "UncialAntiqua-Regular.ttf"
-    if font_file.exists():
-        QFontDatabase.addApplicationFont(str(font_file))
-
-
-def main() -> None:
-    app = QApplication(sys.argv)
-    load_custom_fonts()
-
-    window = MainWindow()
-    window.show()
-
-    sys.exit(app.exec())
-
-
-if __name__ == "__main__":
-    main()
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QFontDatabase
+
+from core import profiling
+
+
+def load_custom_fonts() -> None:
+    """Подключаем Uncial Antiqua из assets/fonts."""
+    fonts_dir = Path(__file__).parent / "assets" / "fonts"
+    font_file = fonts_dir / "UncialAntiqua-Regular.ttf"
+    if font_file.exists():
+        QFontDatabase.addApplicationFont(str(font_file))
+
+
+def parse_profile_args(argv: List[str]) -> Tuple[bool, Optional[Path], List[str]]:
+    """--profile включает профилирование, --profile-out=FILE пишет Chrome trace."""
+    enabled = profiling.enabled_from_env()
+    trace_path: Optional[Path] = None
+    rest: List[str] = []
+    for arg in argv:
+        if arg == "--profile":
+            enabled = True
+        elif arg.startswith("--profile-out="):
+            enabled = True
+            trace_path = Path(arg.split("=", 1)[1])
+        else:
+            rest.append(arg)
+    return enabled, trace_path, rest
+
+
+def main() -> None:
+    profile, trace_path, argv = parse_profile_args(sys.argv)
+    if profile:
+        from gui.diagnostics import install_gui_hooks
+
+        profiling.install()
+        install_gui_hooks()
+
+    # Импорт после install(): Database должна получить профилирующее соединение
+    from gui.main_window import MainWindow
+
+    app = QApplication(argv)
+    load_custom_fonts()
+
+    window = MainWindow()
+    window.show()
+
+    code = app.exec()
+    if profile:
+        print(profiling.profiler.report())
+        if trace_path is not None:
+            profiling.profiler.export_chrome_trace(trace_path)
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
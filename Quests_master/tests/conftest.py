@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import gc
+import json
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pytest
+
+# Бенчмарки гоняются без дисплея
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+BASELINES_PATH = Path(__file__).resolve().parent / "benchmarks_baseline.json"
+# Во сколько раз можно быть медленнее базовой линии, прежде чем тест упадёт
+THRESHOLD = float(os.environ.get("BENCH_THRESHOLD", "1.5"))
+# BENCH_UPDATE=1 записывает базовые линии текущими замерами
+UPDATE = os.environ.get("BENCH_UPDATE") == "1"
+# Сколько раз перемерить, прежде чем признать замедление (шум CI)
+RETRIES = 2
+# В CI замер без базовой линии — ошибка, локально — пропуск
+STRICT = os.environ.get("CI", "") not in ("", "0", "false")
+
+
+def reference_workload() -> None:
+    """Эталонная нагрузка: SQLite в памяти + чистый Python.
+
+    Базовые линии хранятся в долях её времени, поэтому файл с ними
+    годится для машин разной скорости.
+    """
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, title TEXT, reward INTEGER)")
+    conn.executemany(
+        "INSERT INTO t (title, reward) VALUES (?, ?)",
+        [(f"Квест {i}", i % 997) for i in range(20_000)],
+    )
+    for i in range(1000):
+        conn.execute("SELECT * FROM t WHERE id = ?", (i + 1,)).fetchone()
+    conn.execute("SELECT title FROM t ORDER BY reward, id LIMIT 200").fetchall()
+    conn.close()
+    "".join(str(i) for i in range(100_000))
+
+
+class Benchmark:
+    """Замер лучшего времени и сравнение с JSON-базовой линией.
+
+    Замер делится на лучшее время reference_workload, снятое сразу после
+    него (скорость машины «плавает» по ходу прогона); с базовой линией
+    сравнивается это отношение. Лучшее из нескольких запусков шумит
+    меньше медианы: помехи только замедляют код.
+    """
+
+    def __init__(self) -> None:
+        self.baselines: Dict[str, float] = {}
+        if BASELINES_PATH.exists():
+            self.baselines = json.loads(BASELINES_PATH.read_text(encoding="utf-8"))
+        self.dirty = False
+
+    def reference(self) -> float:
+        return self.measure(reference_workload, rounds=5, warmup=0)
+
+    def __call__(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        rounds: int = 5,
+        warmup: int = 1,
+    ) -> float:
+        best = self.measure(func, rounds, warmup)
+        for _ in range(RETRIES):
+            if self.within(name, best):
+                break
+            best = min(best, self.measure(func, rounds, warmup=0))
+        self.check(name, best)
+        return best
+
+    @staticmethod
+    def measure(func: Callable[[], Any], rounds: int = 5, warmup: int = 1) -> float:
+        """Лучшее время вызова из rounds, без сравнения с базой."""
+        for _ in range(warmup):
+            func()
+        gc.collect()
+        samples = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            func()
+            samples.append(time.perf_counter() - start)
+        return min(samples)
+
+    def within(self, name: str, seconds: float) -> bool:
+        baseline = self.baselines.get(name)
+        if UPDATE or baseline is None:
+            return True
+        return seconds / self.reference() <= baseline * THRESHOLD
+
+    def check(self, name: str, seconds: float) -> None:
+        ratio = seconds / self.reference()
+        baseline = self.baselines.get(name)
+        if UPDATE:
+            self.baselines[name] = round(ratio, 4)
+            self.dirty = True
+            return
+        if baseline is None:
+            message = (
+                f"{name}: нет базовой линии в {BASELINES_PATH.name} "
+                f"(запишите её через BENCH_UPDATE=1)"
+            )
+            if STRICT:
+                pytest.fail(message)
+            pytest.skip(message)
+        limit = baseline * THRESHOLD
+        assert ratio <= limit, (
+            f"{name}: {ratio:.3f} эталона ({seconds * 1000:.2f} ms) > {limit:.3f} "
+            f"(база {baseline:.3f}, порог x{THRESHOLD})"
+        )
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        BASELINES_PATH.write_text(
+            json.dumps(self.baselines, indent=2, sort_keys=True, ensure_ascii=False) + "\n",
+            encoding="utf-8",
+        )
+
+
+@pytest.fixture(scope="session")
+def bench():
+    benchmark = Benchmark()
+    yield benchmark
+    benchmark.save()
+
+
+@pytest.fixture(scope="session")
+def weasyprint():
+    """weasyprint без pango падает с OSError, а не ImportError — пропускаем и его."""
+    try:
+        import weasyprint
+    except (ImportError, OSError) as exc:
+        pytest.skip(f"weasyprint недоступен: {exc}")
+    return weasyprint
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    pytest.importorskip("PyQt6")
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+@pytest.fixture
+def db(tmp_path):
+    from core.database import Database
+
+    database = Database(tmp_path / "bench.db")
+    yield database
+    database.conn.close()
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+import pytest
+
+from core.backup import BackupCancelled, backup_database, list_backups, rotate_backups
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    """БД в WAL с проводками, сумма которых всегда 0."""
+    path = tmp_path / "quest_master.db"
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE ledger (id INTEGER PRIMARY KEY, amount INTEGER, pad BLOB)")
+    with conn:
+        for i in range(1000):
+            conn.execute("INSERT INTO ledger (amount, pad) VALUES (?, zeroblob(1024))", (i,))
+            conn.execute("INSERT INTO ledger (amount, pad) VALUES (?, zeroblob(1024))", (-i,))
+    conn.close()
+    return path
+
+
+def test_snapshot_consistent_under_concurrent_writes(ledger, tmp_path):
+    stop = threading.Event()
+    written = []
+
+    def writer() -> None:
+        conn = sqlite3.connect(ledger, timeout=10)
+        n = 0
+        while not stop.is_set():
+            n += 1
+            # Обе строки — в одной транзакции: в снимке либо обе, либо ни одной
+            with conn:
+                conn.execute("INSERT INTO ledger (amount, pad) VALUES (?, zeroblob(512))", (n,))
+                conn.execute("INSERT INTO ledger (amount, pad) VALUES (?, zeroblob(512))", (-n,))
+        conn.close()
+        written.append(n)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        result = backup_database(ledger, tmp_path / "backups", pages_per_step=16, pause=0.001)
+    finally:
+        stop.set()
+        thread.join()
+
+    assert written[0] > 0
+    snapshot = sqlite3.connect(result.path)
+    try:
+        assert snapshot.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+        count, total = snapshot.execute("SELECT COUNT(*), SUM(amount) FROM ledger").fetchone()
+    finally:
+        snapshot.close()
+    assert total == 0
+    assert count % 2 == 0 and count >= 2000
+    assert not list((tmp_path / "backups").glob("*.partial"))
+
+
+def test_failed_backup_removes_partial(ledger, tmp_path):
+    dest = tmp_path / "backups"
+
+    def broken_progress(done: int, total: int) -> None:
+        raise OSError("диск переполнен")
+
+    with pytest.raises(OSError):
+        backup_database(ledger, dest, pages_per_step=8, pause=0, progress=broken_progress)
+    assert list(dest.iterdir()) == []
+
+
+def test_cancelled_backup_removes_partial(ledger, tmp_path):
+    dest = tmp_path / "backups"
+    steps = []
+
+    def cancelled() -> bool:
+        steps.append(1)
+        return len(steps) >= 3
+
+    with pytest.raises(BackupCancelled):
+        backup_database(ledger, dest, pages_per_step=8, pause=0, cancelled=cancelled)
+    assert len(steps) == 3
+    assert list(dest.iterdir()) == []
+
+
+def test_rotate_backups_keeps_newest(tmp_path):
+    stamps = ["20250101_120000", "20250102_090000", "20250102_100000", "20250103_080000"]
+    for stamp in stamps:
+        (tmp_path / f"quest_master-{stamp}.db").write_bytes(b"")
+    other = tmp_path / "other-20250101_000000.db"
+    other.write_bytes(b"")
+
+    removed = rotate_backups(tmp_path, "quest_master", keep=2)
+
+    assert [p.name for p in removed] == [
+        "quest_master-20250102_090000.db",
+        "quest_master-20250101_120000.db",
+    ]
+    assert [p.name for p in list_backups(tmp_path, "quest_master")] == [
+        "quest_master-20250103_080000.db",
+        "quest_master-20250102_100000.db",
+    ]
+    assert other.exists()
+
+
+def test_backup_thread_cancel(qapp, ledger, tmp_path):
+    from gui.backup_worker import BackupThread
+
+    dest = tmp_path / "backups"
+    thread = BackupThread(ledger, dest)
+    results = []
+    thread.completed.connect(results.append)
+    thread.failed.connect(results.append)
+
+    thread.cancel()
+    thread.start()
+    assert thread.wait(5000)
+    qapp.processEvents()
+
+    assert results == []
+    assert list(dest.iterdir()) == []
@@ -0,0 +1,256 @@
+"""Бенчмарки горячих путей: БД, рендер, экспорт, карта, запуск.
+
+Запуск: python -m pytest tests/test_benchmarks.py -v
+Базовые линии — в tests/benchmarks_baseline.json, в долях времени эталонной
+нагрузки (conftest.reference_workload) того же прогона. Тест падает, если
+отношение хуже базы больше чем в BENCH_THRESHOLD раз. Замер без базовой
+линии пропускается, а в CI (переменная CI) падает; BENCH_UPDATE=1
+записывает базовые линии.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+import pytest
+
+
+FAKE_QUEST: Dict[str, Any] = {
+    "id": 1,
+    "title": "Test Quest",
+    "difficulty": "Средний",
+    "reward": 100,
+    "description": "Lorem ipsum " * 20,
+    "deadline": "2025-12-31 23:59",
+    "created_at": "2025-01-01 00:00",
+}
+
+TEMPLATES = ["royal_decree.html", "guild_contract.html", "ancient_scroll.html"]
+
+
+# ---------- БД ----------
+
+def test_autosave_keystrokes(bench, db):
+    """Набор названия по символу: каждый символ — update_quest_field."""
+    quest_id = db.create_draft_quest()
+    text = "Победить дракона в северных горах " * 3
+
+    def type_title() -> None:
+        for i in range(1, len(text) + 1):
+            db.update_quest_field(quest_id, "title", text[:i])
+
+    bench("db.update_quest_field.keystrokes", type_title)
+
+
+def test_get_quest_latency(bench, db):
+    quest_id = db.create_draft_quest()
+
+    def read_many() -> None:
+        for _ in range(1000):
+            db.get_quest(quest_id)
+
+    bench("db.get_quest.x1000", read_many)
+
+
+def test_list_quests_keyset_pages(bench, db):
+    """Листание браузера квестов страницами по 200 в глубину таблицы."""
+    db.conn.executemany(
+        "INSERT INTO quests (title, difficulty, reward, description, deadline) "
+        "VALUES (?, 'Легкий', ?, '', '')",
+        [(f"Квест {i}", i % 997) for i in range(20_000)],
+    )
+    db.conn.commit()
+
+    def scroll() -> None:
+        after = None
+        for _ in range(50):
+            page = db.list_quests_page(limit=200, sort_column="reward", after=after)
+            after = (page[-1][3], page[-1][0])
+
+    bench("db.list_quests_page.reward.x50", scroll)
+
+
+def test_deadline_scheduler_100k(bench, db):
+    """Напоминания о дедлайнах при 100k квестов с дедлайном."""
+    import time
+
+    from core.deadlines import DeadlineScheduler
+
+    start = int(time.time()) + 60
+    db.conn.executemany(
+        "INSERT INTO quests (title, difficulty, reward, description, deadline, deadline_epoch) "
+        "VALUES (?, 'Легкий', 10, '', '', ?)",
+        [(f"Квест {i}", start + i) for i in range(100_000)],
+    )
+    db.conn.commit()
+
+    def drain() -> None:
+        scheduler = DeadlineScheduler(db)
+        fired = scheduler.pop_due(start + 5000)
+        assert len(fired) == 5001
+
+    bench("deadlines.pop_due.5k_of_100k", drain)
+
+
+# ---------- Рендер и экспорт ----------
+
+@pytest.fixture(scope="module")
+def engine():
+    pytest.importorskip("jinja2")
+    from core.template_engine import TemplateEngine
+
+    return TemplateEngine()
+
+
+@pytest.mark.parametrize("template_name", TEMPLATES)
+def test_render_throughput(bench, engine, template_name):
+    def render_many() -> None:
+        for i in range(100):
+            engine.render(dict(FAKE_QUEST, id=i + 1), template_name)
+
+    bench(f"render.{template_name}.x100", render_many)
+
+
+def test_export_pdf(bench, engine, weasyprint, tmp_path):
+    render = engine.render(FAKE_QUEST, "guild_contract.html")
+    out = tmp_path / "quest.pdf"
+
+    bench("export.pdf", lambda: engine.export_pdf(render, out), rounds=3)
+    assert out.stat().st_size > 0
+
+
+def test_export_pdf_booklet(bench, engine, weasyprint, tmp_path):
+    """Буклет из 20 квестов одним PDF против 20 отдельных файлов."""
+    renders = [
+        engine.render(dict(FAKE_QUEST, id=i + 1), TEMPLATES[i % len(TEMPLATES)])
+        for i in range(20)
+    ]
+
+    def separate() -> None:
+        for r in renders:
+            engine.export_pdf(r, tmp_path / "single.pdf")
+
+    out = tmp_path / "booklet.pdf"
+    bench("export.pdf_separate.x20", separate, rounds=1)
+    bench("export.pdf_booklet.x20", lambda: engine.export_pdf_many(renders, out), rounds=1)
+    assert engine.export_pdf_many(renders, out) >= len(renders)
+
+
+def test_export_docx(bench, engine, tmp_path):
+    pytest.importorskip("docx")
+    out = tmp_path / "quest.docx"
+
+    bench("export.docx", lambda: engine.export_docx(FAKE_QUEST, out))
+    assert out.stat().st_size > 0
+
+
+def test_export_docx_skeleton_vs_python_docx_1k(bench, engine, tmp_path):
+    """1000 документов: заготовка против Document() на каждый квест."""
+    quests = [dict(FAKE_QUEST, id=i + 1) for i in range(1000)]
+
+    def skeleton_path() -> None:
+        for quest in quests:
+            engine.export_docx_fast(quest, tmp_path / f"fast_{quest['id']}.docx")
+
+    pytest.importorskip("docx")
+
+    def python_docx_path() -> None:
+        for quest in quests:
+            engine.export_docx(quest, tmp_path / f"slow_{quest['id']}.docx")
+
+    # Сравнение путей не зависит от наличия базовых линий
+    fast = bench.measure(skeleton_path, rounds=3)
+    slow = bench.measure(python_docx_path, rounds=1, warmup=0)
+    assert fast < slow
+    bench.check("export.docx_skeleton.x1000", fast)
+    bench.check("export.docx_python_docx.x1000", slow)
+
+
+def test_export_docx_many_1k(bench, engine, tmp_path):
+    quests = [dict(FAKE_QUEST, id=i + 1) for i in range(1000)]
+    out = tmp_path / "campaign.docx"
+
+    bench("export.docx_many.x1000", lambda: engine.export_docx_many(quests, out))
+    assert out.stat().st_size > 0
+
+
+# ---------- Карта ----------
+
+@pytest.fixture
+def map_view(qapp, db):
+    from gui.map_editor import MapView
+
+    view = MapView(db)
+    view.set_quest(db.create_draft_quest())
+    yield view
+    view.deleteLater()
+
+
+def _mouse_event(kind, x: float, y: float):
+    from PyQt6.QtCore import QPointF, Qt
+    from PyQt6.QtGui import QMouseEvent
+
+    pos = QPointF(x, y)
+    return QMouseEvent(
+        kind,
+        pos,
+        pos,
+        Qt.MouseButton.LeftButton,
+        Qt.MouseButton.LeftButton,
+        Qt.KeyboardModifier.NoModifier,
+    )
+
+
+def test_map_brush_stroke(bench, map_view):
+    from PyQt6.QtCore import QEvent
+
+    def stroke() -> None:
+        map_view.set_mode("brush")
+        map_view.mousePressEvent(_mouse_event(QEvent.Type.MouseButtonPress, 10, 10))
+        for i in range(500):
+            x = 10 + i % 780
+            map_view.mouseMoveEvent(_mouse_event(QEvent.Type.MouseMove, x, 10 + i % 580))
+        map_view.mouseReleaseEvent(_mouse_event(QEvent.Type.MouseButtonRelease, 10, 10))
+
+    bench("map.brush_stroke.x500", stroke, rounds=3)
+
+
+def test_map_markers(bench, map_view):
+    from PyQt6.QtCore import QPointF
+
+    def add_markers() -> None:
+        for i in range(100):
+            map_view._add_marker(QPointF(10 + i * 7, 300), "city")
+
+    bench("map.add_marker.x100", add_markers, rounds=3)
+
+
+def test_scene_to_image(bench, map_view):
+    from PyQt6.QtCore import QPointF
+
+    for i in range(200):
+        map_view._draw_point(QPointF(i * 4, i * 3))
+    bench("map.scene_to_image", map_view._scene_to_image)
+
+
+# ---------- Запуск ----------
+
+def test_startup(bench, qapp, tmp_path, monkeypatch):
+    pytest.importorskip("jinja2")
+    pytest.importorskip("PyQt6.QtMultimedia")
+    import main
+    from core.database import Database
+    from gui import main_window
+
+    monkeypatch.setattr(main_window, "Database", lambda: Database(tmp_path / "startup.db"))
+
+    def start() -> None:
+        main.load_custom_fonts()
+        window = main_window.MainWindow()
+        window.show()
+        qapp.processEvents()
+        window.close()
+        window.db.conn.close()
+        window.deleteLater()
+
+    bench("app.startup", start, rounds=3)
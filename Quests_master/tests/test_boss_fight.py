@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("jinja2")
+
+from core.template_engine import BatchExporter
+
+
+def test_boss_fight(bench):
+    """100 контрактов гильдии подряд."""
+    results = BatchExporter.generate_100_quests()
+    assert len(results) == 100
+    assert "#100" in results[-1]
+    bench("boss_fight.generate_100_quests", BatchExporter.generate_100_quests)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from core.campaigns import ATTACH_BATCH, CampaignStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    campaigns = CampaignStore(tmp_path / "campaigns", max_open=3, idle_timeout=300)
+    yield campaigns
+    campaigns.close()
+
+
+def test_catalog(tmp_path):
+    store = CampaignStore(tmp_path / "campaigns")
+    first = store.create_campaign("Север")
+    second = store.create_campaign("Юг")
+
+    assert [(c["id"], c["name"], c["file"]) for c in store.list_campaigns()] == [
+        (first, "Север", f"campaign_{first}.db"),
+        (second, "Юг", f"campaign_{second}.db"),
+    ]
+    with pytest.raises(KeyError):
+        store.shard(999)
+    store.close()
+
+    # Каталог переживает переоткрытие хранилища
+    reopened = CampaignStore(tmp_path / "campaigns")
+    try:
+        assert [c["name"] for c in reopened.list_campaigns()] == ["Север", "Юг"]
+    finally:
+        reopened.close()
+
+
+def test_lru_eviction(store):
+    ids = [store.create_campaign(f"Кампания {i}") for i in range(5)]
+    for campaign_id in ids[:3]:
+        store.shard(campaign_id)
+    store.shard(ids[0])  # освежаем первую
+
+    store.shard(ids[3])
+    assert store.open_shards() == [ids[2], ids[0], ids[3]]
+    store.shard(ids[4])
+    assert store.open_shards() == [ids[0], ids[3], ids[4]]
+
+
+def test_idle_shards_closed(tmp_path):
+    store = CampaignStore(tmp_path / "campaigns", max_open=8, idle_timeout=0.05)
+    try:
+        old, fresh = store.create_campaign("Старая"), store.create_campaign("Новая")
+        store.shard(old)
+        time.sleep(0.1)
+        store.shard(fresh)
+        assert store.open_shards() == [fresh]
+        time.sleep(0.1)
+        assert store.close_idle() == [fresh]
+        assert store.open_shards() == []
+    finally:
+        store.close()
+
+
+def test_handle_reopens_evicted_shard(store):
+    first = store.create_campaign("Первая")
+    handle = store.shard(first)
+    quest_id = handle.create_draft_quest()
+    handle.update_quest_field(quest_id, "title", "Дракон")
+
+    for i in range(store.max_open):
+        store.shard(store.create_campaign(f"Другая {i}"))
+    assert first not in store.open_shards()
+
+    assert handle.get_quest(quest_id).title == "Дракон"
+    assert store.open_shards()[-1] == first
+
+
+def test_search_across_more_than_attach_batch(store):
+    count = ATTACH_BATCH * 2 + 3
+    ids = [store.create_campaign(f"Кампания {i}") for i in range(count)]
+    never_opened = store.create_campaign("Пустая")
+    for n, campaign_id in enumerate(ids):
+        db = store.shard(campaign_id)
+        for kind in ("дракон", "тролль"):
+            quest_id = db.create_draft_quest()
+            db.conn.execute(
+                "UPDATE quests SET title = ?, created_at = ? WHERE id = ?",
+                (f"{kind} {n}", f"2025-01-01 00:{n:02d}:00", quest_id),
+            )
+        db.conn.commit()
+
+    found = store.search_quests("дракон", limit=100)
+    assert [r["campaign_id"] for r in found] == ids[::-1]
+    assert all(r["title"].startswith("дракон") for r in found)
+    assert never_opened not in {r["campaign_id"] for r in found}
+
+    top = store.search_quests(limit=5)
+    assert [r["campaign_id"] for r in top] == [ids[-1], ids[-1], ids[-2], ids[-2], ids[-3]]
+
+    # После поиска к каталогу ничего не приаттачено
+    assert [row[1] for row in store.catalog.execute("PRAGMA database_list")] == ["main"]
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from core.data_transfer import export_table, import_table, read_records
+from core.database import Database
+
+
+def _fill(db, count):
+    db.conn.executemany(
+        "INSERT INTO quests (id, title, difficulty, reward, description, deadline) "
+        "VALUES (?, ?, 'Легкий', ?, ?, ?)",
+        [
+            (i, f"Квест {i}", i * 10, 'описание, с "кавычками"\nи строкой', f"2025-01-{i % 28 + 1:02d} 12:00")
+            for i in range(1, count + 1)
+        ],
+    )
+    db.conn.commit()
+
+
+def _quests(db):
+    return [
+        tuple(row)
+        for row in db.conn.execute(
+            "SELECT id, title, difficulty, reward, description, deadline FROM quests ORDER BY id"
+        )
+    ]
+
+
+@pytest.fixture
+def target(tmp_path):
+    database = Database(tmp_path / "target.db")
+    yield database
+    database.conn.close()
+
+
+@pytest.mark.parametrize("name", ["quests.jsonl", "quests.jsonl.gz", "quests.csv", "quests.csv.gz"])
+def test_round_trip(db, target, tmp_path, name):
+    _fill(db, 25)
+    path = tmp_path / name
+
+    assert export_table(db, "quests", path, batch_size=7) == 25
+    assert import_table(target, "quests", path, batch_size=7) == 25
+
+    assert _quests(target) == _quests(db)
+    # deadline_epoch не выгружается, но восстанавливается после импорта
+    missing = target.conn.execute(
+        "SELECT COUNT(*) FROM quests WHERE deadline_epoch IS NULL"
+    ).fetchone()[0]
+    assert missing == 0
+
+
+def test_csv_empty_cells(tmp_path):
+    path = tmp_path / "quests.csv"
+    path.write_text(
+        "id,title,difficulty,reward,description,deadline,created_at\n"
+        "1,,Легкий,,,,\n",
+        encoding="utf-8",
+    )
+    # Пустая нетекстовая ячейка — NULL, пустая текстовая — пустая строка
+    assert list(read_records(path, "quests")) == [("1", "", "Легкий", None, "", "", "")]
+
+
+def test_csv_null_reward_round_trip(db, target, tmp_path):
+    _fill(db, 3)
+    db.conn.execute("UPDATE quests SET reward = NULL WHERE id = 2")
+    db.conn.commit()
+    path = tmp_path / "quests.csv"
+
+    export_table(db, "quests", path)
+    import_table(target, "quests", path)
+
+    assert target.conn.execute("SELECT reward FROM quests WHERE id = 2").fetchone()[0] is None
+
+
+def _fail_after_first_batch(rows):
+    raise RuntimeError("обрыв импорта")
+
+
+def test_resume_after_failed_batch(db, target, tmp_path):
+    _fill(db, 20)
+    path = tmp_path / "quests.jsonl"
+    export_table(db, "quests", path)
+
+    with pytest.raises(RuntimeError):
+        import_table(target, "quests", path, batch_size=8, progress=_fail_after_first_batch)
+    assert len(_quests(target)) == 8
+
+    # on_conflict=abort: повторная вставка первой пачки упала бы на id
+    assert import_table(target, "quests", path, batch_size=8) == 20
+    assert _quests(target) == _quests(db)
+    assert target.conn.execute("SELECT COUNT(*) FROM import_checkpoints").fetchone()[0] == 0
+
+
+def test_replaced_file_is_not_skipped(target, tmp_path):
+    path = tmp_path / "quests.jsonl"
+
+    def write(ids):
+        with open(path, "w", encoding="utf-8") as fh:
+            for i in ids:
+                fh.write(json.dumps({"id": i, "title": f"Квест {i}", "difficulty": "Легкий",
+                                     "reward": i, "description": "", "deadline": ""}) + "\n")
+
+    write(range(1, 21))
+    with pytest.raises(RuntimeError):
+        import_table(target, "quests", path, batch_size=8, progress=_fail_after_first_batch)
+
+    write(range(101, 121))
+    assert import_table(target, "quests", path, batch_size=8) == 20
+    ids = [row[0] for row in target.conn.execute("SELECT id FROM quests WHERE id > 100")]
+    assert ids == list(range(101, 121))
+
+
+def test_cli_import_conflict_suggests_flag(db, tmp_path, capsys):
+    from core.data_transfer import main
+
+    _fill(db, 3)
+    path = tmp_path / "quests.jsonl"
+    export_table(db, "quests", path)
+    target_path = tmp_path / "gui.db"
+    gui_db = Database(target_path)
+    gui_db.create_draft_quest()  # GUI уже создал черновик с id 1
+    gui_db.close()
+
+    with pytest.raises(SystemExit) as exit_info:
+        main(["import", "quests", str(path), "--db", str(target_path)])
+    assert exit_info.value.code == 1
+    assert "--on-conflict skip" in capsys.readouterr().err
+
+    main(["import", "quests", str(path), "--db", str(target_path), "--on-conflict", "skip"])
+    check = Database(target_path)
+    try:
+        assert check.conn.execute("SELECT COUNT(*) FROM quests").fetchone()[0] == 3
+    finally:
+        check.close()
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from core import database
+from core.database import SORTABLE_QUEST_COLUMNS, Database, deadline_to_epoch
+
+
+def _page_through(db, sort_column, descending, limit=2):
+    column = SORTABLE_QUEST_COLUMNS.index(sort_column)
+    seen = []
+    after = None
+    while True:
+        page = db.list_quests_page(
+            limit=limit, sort_column=sort_column, descending=descending, after=after
+        )
+        if not page:
+            return seen
+        seen.extend(row[0] for row in page)
+        after = (page[-1][column], page[-1][0])
+
+
+@pytest.mark.parametrize("sort_column", ["reward", "deadline"])
+@pytest.mark.parametrize("descending", [False, True])
+def test_keyset_pages_include_null_sort_keys(db, sort_column, descending):
+    ids = [db.create_draft_quest() for _ in range(7)]
+    values = {"reward": [30, None, 10, None, 20, 10, None],
+              "deadline": ["2025-03-01", None, "2025-01-01", None, "2025-02-01", "", None]}
+    for quest_id, value in zip(ids, values[sort_column]):
+        db.conn.execute(
+            f"UPDATE quests SET {sort_column} = ? WHERE id = ?", (value, quest_id)
+        )
+    db.conn.commit()
+
+    expected = [
+        row[0]
+        for row in db.conn.execute(
+            f"SELECT id FROM quests ORDER BY {sort_column} "
+            f"{'DESC' if descending else 'ASC'}, id {'DESC' if descending else 'ASC'}"
+        )
+    ]
+    assert _page_through(db, sort_column, descending) == expected
+    assert sorted(expected) == sorted(ids)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, None),
+        ("", None),
+        ("   ", None),
+        ("не дата", None),
+        ("2025-13-01T00:00:00", None),
+        ("2025-01-01T00:00:00Z", 1735689600),
+        ("2025-01-01T03:00:00+03:00", 1735689600),
+        ("9999-12-31T23:59:59+00:00", 253402300799),
+        # Переход через границу datetime при переводе в UTC
+        ("9999-12-31T23:59:59-05:00", None),
+        ("0001-01-01T00:00:00+05:00", None),
+    ],
+)
+def test_deadline_to_epoch(value, expected):
+    assert deadline_to_epoch(value) == expected
+
+
+def test_deadline_to_epoch_naive_is_local():
+    local = datetime(2025, 6, 1, 12, 30)
+    assert deadline_to_epoch("2025-06-01T12:30:00") == int(local.timestamp())
+
+
+@pytest.mark.parametrize(
+    "value",
+    # Границы QDateTimeEdit и минимальная дата datetime: зависят от часового
+    # пояса и платформы, но не должны бросать исключение
+    ["1752-09-14T00:00:00", "9999-12-31T23:59:59", "9999-12-31T23:59:59.999", "0001-01-01T00:00:00"],
+)
+def test_deadline_to_epoch_edge_dates(value):
+    result = deadline_to_epoch(value)
+    assert result is None or isinstance(result, int)
+
+
+def _old_schema_db(path, count):
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE quests (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, "
+        "difficulty TEXT, reward INTEGER, description TEXT, deadline TEXT, "
+        "created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+    )
+    conn.executemany(
+        "INSERT INTO quests (title, deadline) VALUES (?, ?)",
+        [(f"Квест {i}", f"2025-01-01T00:00:{i % 60:02d}+00:00") for i in range(count)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_deadline_epoch_migration_is_atomic(tmp_path, monkeypatch):
+    path = tmp_path / "old.db"
+    _old_schema_db(path, 10)
+    monkeypatch.setattr(database, "MIGRATION_BATCH", 3)
+
+    calls = []
+
+    def failing(value):
+        calls.append(value)
+        if len(calls) > 5:
+            raise RuntimeError("прервано")
+        return 0
+
+    monkeypatch.setattr(database, "deadline_to_epoch", failing)
+    with pytest.raises(RuntimeError):
+        Database(path)
+
+    conn = sqlite3.connect(path)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(quests)")}
+    conn.close()
+    assert "deadline_epoch" not in columns
+
+    monkeypatch.undo()
+    db = Database(path)
+    try:
+        missing = db.conn.execute(
+            "SELECT COUNT(*) FROM quests WHERE deadline_epoch IS NULL"
+        ).fetchone()[0]
+        assert missing == 0
+    finally:
+        db.close()
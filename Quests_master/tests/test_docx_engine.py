@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import zipfile
+from datetime import datetime
+from xml.etree import ElementTree
+
+import pytest
+
+from core.docx_engine import DOCUMENT_PART, DocxEngine, _escape
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+NOW = datetime(2025, 5, 1, 9, 30)
+
+QUEST = {
+    "id": 7,
+    "title": "Tom & Jerry <3 > всё",
+    "difficulty": "Сложный",
+    "reward": None,
+    "description": "строка 1\nстрока\x002\x0b\x1f\nстрока 3",
+    "deadline": "2025-12-31 23:59",
+    "created_at": "2025-01-01 00:00",
+}
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return DocxEngine()
+
+
+def _texts(root):
+    return "".join(t.text or "" for t in root.iter(f"{W}t"))
+
+
+def test_escape():
+    assert _escape("a & b < c > d") == "a &amp; b &lt; c &gt; d"
+    assert _escape(None) == ""
+    assert _escape(42) == "42"
+    assert _escape("x\x00\x08\x0b\x0c\x0e\x1fy\t") == "xy\t"
+    assert _escape("a\nb") == 'a</w:t><w:br/><w:t xml:space="preserve">b'
+
+
+@pytest.mark.parametrize("template", ["guild_contract.html", "royal_decree.html", "ancient_scroll.html"])
+def test_document_xml_is_well_formed(engine, template):
+    xml = engine.skeleton(template).render_xml([QUEST], NOW)
+    root = ElementTree.fromstring(xml.encode("utf-8"))
+
+    text = _texts(root)
+    assert "Tom & Jerry <3 > всё" in text
+    assert "строка 1" in text and "строка2" in text and "строка 3" in text
+    assert "None" not in text
+    assert "{{" not in text
+    assert len(list(root.iter(f"{W}br"))) == 2
+
+
+def test_build_writes_complete_package(engine, tmp_path):
+    out = tmp_path / "quest.docx"
+    engine.export(QUEST, out, "guild_contract.html")
+
+    with zipfile.ZipFile(out) as zf:
+        assert zf.testzip() is None
+        names = zf.namelist()
+        with zipfile.ZipFile(engine.skeleton("guild_contract.html").path) as src:
+            assert sorted(names) == sorted(src.namelist())
+        assert names.count(DOCUMENT_PART) == 1
+        root = ElementTree.fromstring(zf.read(DOCUMENT_PART))
+    assert "#7" in _texts(root)
+
+
+@pytest.mark.parametrize("count", [1, 2, 5])
+def test_export_many_section_breaks(engine, tmp_path, count):
+    quests = [dict(QUEST, id=i + 1, title=f"Квест {i + 1}") for i in range(count)]
+    out = tmp_path / "campaign.docx"
+    engine.export_many(quests, out, "royal_decree.html")
+
+    with zipfile.ZipFile(out) as zf:
+        root = ElementTree.fromstring(zf.read(DOCUMENT_PART))
+    body = root.find(f"{W}body")
+    # Разрывы — sectPr внутри абзацев; последний sectPr — у самого body
+    breaks = [p for p in body.findall(f"{W}p") if p.find(f"{W}pPr/{W}sectPr") is not None]
+    assert len(breaks) == count - 1
+    assert body[-1].tag == f"{W}sectPr"
+    text = _texts(root)
+    assert all(f"Квест {i + 1}" in text for i in range(count))
+
+
+def test_unknown_template(engine):
+    with pytest.raises(FileNotFoundError):
+        engine.skeleton("missing.html")
+    assert engine.skeleton("guild_contract.html") is engine.skeleton("guild_contract.html")
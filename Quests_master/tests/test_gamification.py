@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from core.gamification import ACHIEVEMENTS_LIMIT, EVENT_XP, XPManager
+
+
+class RecordingDb:
+    def __init__(self):
+        self.calls = []
+
+    def add_achievements(self, texts):
+        self.calls.append(list(texts))
+
+
+def test_achievements_buffer_is_capped():
+    manager = XPManager()
+    for _ in range(ACHIEVEMENTS_LIMIT * 3):
+        manager.add_event("export")
+
+    achievements = manager.state.achievements
+    assert len(achievements) == ACHIEVEMENTS_LIMIT
+    assert achievements.maxlen == ACHIEVEMENTS_LIMIT
+
+
+def test_achievements_history_pages(db):
+    db.add_achievements([f"запись {i}" for i in range(7)])
+    db.add_achievements([])
+
+    first = db.get_achievements(limit=3)
+    assert [row["text"] for row in first] == ["запись 6", "запись 5", "запись 4"]
+    second = db.get_achievements(limit=3, before_id=first[-1]["id"])
+    assert [row["text"] for row in second] == ["запись 3", "запись 2", "запись 1"]
+    last = db.get_achievements(limit=3, before_id=second[-1]["id"])
+    assert [row["text"] for row in last] == ["запись 0"]
+
+
+def test_add_events_batch_totals_and_level_ups():
+    db = RecordingDb()
+    manager = XPManager(db)
+
+    update = manager.add_events(["boss_fight"] * 5 + ["unknown", "export"])
+
+    assert update.events == 7
+    assert update.gained_xp == 5 * EVENT_XP["boss_fight"] + EVENT_XP["export"]
+    assert (update.xp, update.level) == (102, "Архимаг документов")
+    # 60 XP — порог 50, 100 XP — порог 100
+    assert update.level_ups == ["Мастер пергаментов", "Архимаг документов"]
+    assert update.new_achievements == [
+        "+20 XP: boss_fight",
+        "+20 XP: boss_fight",
+        "+20 XP: boss_fight",
+        "Новый уровень: Мастер пергаментов",
+        "+20 XP: boss_fight",
+        "+20 XP: boss_fight",
+        "Новый уровень: Архимаг документов",
+        "+2 XP: export",
+    ]
+    assert db.calls == [update.new_achievements]
+    assert list(manager.state.achievements) == update.new_achievements
+
+
+def test_add_events_without_xp_writes_nothing():
+    db = RecordingDb()
+    manager = XPManager(db)
+
+    update = manager.add_events(["unknown", "unknown"])
+
+    assert (update.events, update.gained_xp, update.new_achievements) == (2, 0, [])
+    assert db.calls == []
+
+
+def test_add_event_returns_state():
+    manager = XPManager()
+    assert manager.add_event("save_map") == (EVENT_XP["save_map"], "Ученик")
+
+
+def test_level_ups_survive_restart(db):
+    XPManager(db).add_events(["boss_fight"] * 3)
+    texts = [row["text"] for row in reversed(db.get_achievements())]
+    assert texts[-1] == "Новый уровень: Мастер пергаментов"
+
+
+@pytest.fixture
+def achievements_model(qapp):
+    pytest.importorskip("PyQt6.QtMultimedia")
+    from gui.gamification_panel import AchievementsModel
+
+    return AchievementsModel(limit=3)
+
+
+def _texts(model):
+    return [model.data(model.index(row)) for row in range(model.rowCount())]
+
+
+def test_achievements_model_evicts_oldest(achievements_model):
+    removed, inserted = [], []
+    achievements_model.rowsRemoved.connect(lambda _p, first, last: removed.append((first, last)))
+    achievements_model.rowsInserted.connect(lambda _p, first, last: inserted.append((first, last)))
+
+    achievements_model.append_items(["a", "b"])
+    achievements_model.append_items(["c", "d"])
+
+    assert _texts(achievements_model) == ["b", "c", "d"]
+    assert removed == [(0, 0)]
+    assert inserted == [(0, 1), (1, 2)]
+
+
+def test_achievements_model_batch_larger_than_limit(achievements_model):
+    achievements_model.append_items(["a"])
+    achievements_model.append_items([str(i) for i in range(10)])
+
+    assert _texts(achievements_model) == ["7", "8", "9"]
+
+
+def test_load_history_shows_latest(qapp, db):
+    pytest.importorskip("PyQt6.QtMultimedia")
+    from gui.gamification_panel import GamificationPanel
+
+    db.add_achievements([f"запись {i}" for i in range(ACHIEVEMENTS_LIMIT + 5)])
+    panel = GamificationPanel()
+    panel.load_history(db)
+
+    model = panel.achievements_model
+    assert model.rowCount() == ACHIEVEMENTS_LIMIT
+    assert _texts(model)[-1] == f"запись {ACHIEVEMENTS_LIMIT + 4}"
+    assert _texts(model)[0] == "запись 5"
+
+
+def test_event_bus_coalesces_posts(qapp):
+    from gui.xp_event_bus import XPEventBus
+
+    db = RecordingDb()
+    bus = XPEventBus(XPManager(db))
+    updates = []
+    bus.updated.connect(updates.append)
+
+    for _ in range(10):
+        bus.post("export")
+    assert updates == []
+
+    deadline = time.monotonic() + 2
+    while not updates and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.005)
+    qapp.processEvents()
+
+    assert len(updates) == 1
+    assert (updates[0].events, updates[0].gained_xp) == (10, 10 * EVENT_XP["export"])
+    assert len(db.calls) == 1
+    assert bus.flush() is None
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import Any, List, Tuple
+
+import pytest
+
+TEMPLATES = ["royal_decree.html", "guild_contract.html", "ancient_scroll.html"]
+
+QUEST = {
+    "id": 3,
+    "title": "Дракон & тролль",
+    "difficulty": "Эпический",
+    "reward": 500,
+    "description": "Длинное описание квеста. " * 120,
+    "deadline": "2025-12-31 23:59",
+    "created_at": "2025-01-01 00:00",
+}
+
+
+@pytest.fixture(scope="module")
+def engine():
+    pytest.importorskip("jinja2")
+    from core.template_engine import TemplateEngine
+
+    return TemplateEngine()
+
+
+def _number(value: Any) -> Any:
+    return round(value, 1) if isinstance(value, (int, float)) else value
+
+
+def _layout(document) -> List[Tuple[Any, ...]]:
+    """Размеры страниц и геометрия всех боксов — «отпечаток» оформления."""
+    layout = []
+    for page in document.pages:
+        layout.append(("page", _number(page.width), _number(page.height)))
+        for box in page._page_box.descendants():
+            layout.append(
+                (
+                    type(box).__name__,
+                    getattr(box, "text", None),
+                    _number(box.position_x),
+                    _number(box.position_y),
+                    _number(box.width),
+                    _number(box.height),
+                )
+            )
+    return layout
+
+
+@pytest.mark.parametrize("template_name", TEMPLATES)
+def test_cached_stylesheet_matches_inline_style(engine, weasyprint, template_name):
+    html = engine.render(QUEST, template_name).html
+    session = engine.pdf_session
+
+    plain = weasyprint.HTML(string=html, base_url=session.base_url).render()
+    cached = session.render_document(html, template_name)
+
+    assert len(cached.pages) == len(plain.pages)
+    assert _layout(cached) == _layout(plain)
+    # Повторный рендер в той же сессии даёт то же самое
+    assert _layout(session.render_document(html, template_name)) == _layout(plain)
+
+
+def test_combined_booklet_keeps_every_page(engine, weasyprint, tmp_path):
+    session = engine.pdf_session
+    documents = [
+        (engine.render(dict(QUEST, id=i + 1), name).html, name)
+        for i, name in enumerate(TEMPLATES)
+    ]
+    expected = sum(len(session.render_document(html, name).pages) for html, name in documents)
+
+    out = tmp_path / "booklet.pdf"
+    assert session.write_combined(documents, out) == expected
+    assert out.read_bytes().startswith(b"%PDF")
+
+    with pytest.raises(ValueError):
+        session.write_combined([], tmp_path / "empty.pdf")
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import pytest
+
+from core import profiling
+from core.database import Database
+
+
+@pytest.fixture
+def profiled_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(Database, "connection_factory", profiling.ProfiledConnection)
+    monkeypatch.setattr(profiling.profiler, "enabled", True)
+    profiling.profiler.reset()
+    db = Database(tmp_path / "profiled.db")
+    yield db
+    db.close()
+    profiling.profiler.reset()
+
+
+def test_commits_through_context_manager_are_counted(profiled_db):
+    profiling.profiler.reset()
+    with profiled_db.conn as conn:
+        conn.execute("INSERT INTO achievements (text) VALUES ('a')")
+    profiled_db.add_achievements(["b"])
+    assert profiling.profiler.counters["sqlite.commits"] == 2
+
+
+def test_fetch_time_recorded_separately(profiled_db):
+    profiled_db.create_draft_quest()
+    profiling.profiler.reset()
+    profiled_db.list_quests_page(limit=10)
+    fetch_keys = [k for k in profiling.profiler.stats if k.endswith("[fetch]")]
+    assert any("FROM quests" in k for k in fetch_keys)
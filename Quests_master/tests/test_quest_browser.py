@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import pytest
+
+from core.database import SORTABLE_QUEST_COLUMNS
+
+
+@pytest.fixture
+def model(qapp, db):
+    from gui.quest_browser import QuestTableModel
+
+    db.conn.executemany(
+        "INSERT INTO quests (title, difficulty, reward, description, deadline) "
+        "VALUES (?, 'Легкий', ?, '', '')",
+        [(f"Квест {i}", None if i % 7 == 0 else i % 13) for i in range(237)],
+    )
+    db.conn.commit()
+    return QuestTableModel(db, page_size=10, window_pages=3)
+
+
+def _ids(model):
+    return [model.quest_id_at(row) for row in range(model.rowCount())]
+
+
+def _expected(db, column, descending):
+    order = "DESC" if descending else "ASC"
+    return [
+        row[0]
+        for row in db.conn.execute(f"SELECT id FROM quests ORDER BY {column} {order}, id {order}")
+    ]
+
+
+@pytest.mark.parametrize("column, descending", [("id", False), ("reward", False), ("reward", True)])
+def test_window_stays_bounded_both_ways(model, db, column, descending):
+    from PyQt6.QtCore import Qt
+
+    order = Qt.SortOrder.DescendingOrder if descending else Qt.SortOrder.AscendingOrder
+    model.sort(SORTABLE_QUEST_COLUMNS.index(column), order)
+    expected = _expected(db, column, descending)
+
+    while model.canFetchMore():
+        model.fetchMore()
+        assert model.rowCount() <= model.max_rows
+        window = _ids(model)
+        start = expected.index(window[0])
+        assert window == expected[start:start + len(window)]
+    assert _ids(model) == expected[-model.max_rows:]
+    assert model.can_fetch_previous()
+
+    while model.can_fetch_previous():
+        model.fetch_previous()
+        assert model.rowCount() <= model.max_rows
+        window = _ids(model)
+        start = expected.index(window[0])
+        assert window == expected[start:start + len(window)]
+    assert _ids(model) == expected[:model.max_rows]
+
+    # Снова вниз: выброшенные снизу страницы читаются заново
+    assert model.canFetchMore()
+    model.fetchMore()
+    assert _ids(model) == expected[10:10 + model.max_rows]
+
+
+def test_window_shift_signal(model):
+    shifts = []
+    model.window_shifted.connect(shifts.append)
+
+    for _ in range(4):
+        model.fetchMore()
+    assert model.rowCount() == model.max_rows
+    assert shifts == [-10]
+    assert model.fetch_previous() == 10
+    assert shifts == [-10, 10]